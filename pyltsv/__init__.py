@@ -1,10 +1,15 @@
 """Python Library for LTSV."""
 
+from . import aggregate
+from . import merge
 from . import read
+from . import rotate
+from . import sort
 from . import write
 
 breader = read.breader
 reader = read.reader
+IncrementalParser = read.IncrementalParser
 ParserConfigError = read.BaseLineParser.ParserConfigError
 ParseError = read.BaseLineParser.ParseError
 EmptyFieldParseError = read.BaseLineParser.EmptyFieldParseError
@@ -18,3 +23,13 @@ FormatterConfigError = write.BaseLineFormatter.FormatterConfigError
 FormatError = write.BaseLineFormatter.FormatError
 InvalidInputFormatError = write.BaseLineFormatter.InvalidInputFormatError
 InvalidValueFormatError = write.BaseLineFormatter.InvalidValueFormatError
+RotatingWriter = rotate.RotatingWriter
+
+merge_readers = merge.merge_readers
+MergeError = merge.MergeError
+KeyNotFoundError = merge.KeyNotFoundError
+OutOfOrderError = merge.OutOfOrderError
+
+sort_file = sort.sort_file
+
+Aggregator = aggregate.Aggregator
@@ -0,0 +1,8 @@
+"""Run pyltsv command."""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
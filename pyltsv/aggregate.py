@@ -0,0 +1,359 @@
+"""Streaming aggregation over LTSV records."""
+
+import math
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+# Values closer to zero than this are counted as zero
+_MIN_INDEXABLE = 1e-9
+
+_GROUP_KEY = Tuple[Any, ...]
+
+
+class _BucketStore(object):
+    """Counts of logarithmic buckets of one sign."""
+
+    def __init__(self):
+        # type: () -> None
+        """Initialize."""
+        self.buckets = {}  # type: Dict[int, int]
+        # Buckets below this index were collapsed into it
+        self.floor = None  # type: Optional[int]
+        return
+
+    def add(self, index, n=1):
+        # type: (int, int) -> None
+        """Add count to bucket.
+
+        :param index: Bucket index
+        :param n: Count to add
+        """
+        if self.floor is not None and index < self.floor:
+            index = self.floor
+        self.buckets[index] = self.buckets.get(index, 0) + n
+        return
+
+    def collapse(self, max_buckets):
+        # type: (int) -> None
+        """Merge lowest buckets so that at most max_buckets are left.
+
+        :param max_buckets: Max number of buckets
+        """
+        if len(self.buckets) <= max_buckets:
+            return
+        keys = sorted(self.buckets)
+        target = keys[len(keys) - max_buckets]
+        for k in keys[: len(keys) - max_buckets]:
+            self.buckets[target] += self.buckets.pop(k)
+        self.floor = target
+        return
+
+
+class QuantileSketch(object):
+    """Mergeable sketch of approximate quantiles.
+
+    Values are counted in logarithmic buckets so that estimated quantiles
+    are within relative_accuracy of the actual values. When more than
+    max_buckets buckets are used, buckets of values closest to zero are
+    merged, which only loses accuracy of low quantiles.
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        # type: (float, int) -> None
+        """Initialize.
+
+        :param relative_accuracy: Relative accuracy of estimated quantiles
+        :param max_buckets: Max number of buckets for each sign
+        :raises ValueError: Invalid parameter given
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be positive")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = _BucketStore()
+        self._negative = _BucketStore()
+        self._zero = 0
+        return
+
+    def add(self, x):
+        # type: (float) -> None
+        """Add one value.
+
+        :param x: Value to add
+        :raises ValueError: NaN or infinity given
+        """
+        if math.isnan(x) or math.isinf(x):
+            raise ValueError("Cannot add NaN or infinity to sketch")
+        if x > _MIN_INDEXABLE:
+            store = self._positive
+        elif x < -_MIN_INDEXABLE:
+            store = self._negative
+            x = -x
+        else:
+            self._zero += 1
+            self.count += 1
+            return
+        store.add(int(math.ceil(math.log(x) / self._log_gamma)))
+        if len(store.buckets) > self.max_buckets:
+            store.collapse(self.max_buckets)
+        self.count += 1
+        return
+
+    def merge(self, other):
+        # type: (QuantileSketch) -> None
+        """Merge counts of another sketch into this one.
+
+        :param other: Sketch to merge
+        :raises ValueError: Sketches of different accuracy given
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches of different accuracy")
+        for store, other_store in (
+            (self._positive, other._positive),
+            (self._negative, other._negative),
+        ):
+            for index, n in other_store.buckets.items():
+                store.add(index, n)
+            store.collapse(self.max_buckets)
+        self._zero += other._zero
+        self.count += other.count
+        return
+
+    def quantile(self, q):
+        # type: (float) -> Optional[float]
+        """Get estimated quantile.
+
+        :param q: Quantile between 0 and 1
+        :returns: Estimated value, or None when no value has been added
+        :raises ValueError: Invalid quantile given
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self._negative.buckets, reverse=True):
+            seen += self._negative.buckets[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self._zero
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive.buckets):
+            seen += self._positive.buckets[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self._positive.buckets))  # pragma: no cover
+
+    def _value(self, index):
+        # type: (int) -> float
+        """Get representative value of bucket.
+
+        :param index: Bucket index
+        :returns: Value
+        """
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+
+class GroupStats(object):
+    """Statistics of one group."""
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        # type: (float, int) -> None
+        """Initialize.
+
+        :param relative_accuracy: Relative accuracy of estimated quantiles
+        :param max_buckets: Max number of buckets of quantile sketch
+        """
+        # The number of records
+        self.count = 0
+        # The number of numeric values
+        self.n = 0
+        self.sum = 0.0
+        self.min = None  # type: Optional[float]
+        self.max = None  # type: Optional[float]
+        self.sketch = QuantileSketch(relative_accuracy, max_buckets)
+        return
+
+    def add(self, x):
+        # type: (Optional[float]) -> None
+        """Add one record.
+
+        :param x: Value of the record, or None when it has no numeric value
+        """
+        self.count += 1
+        if x is None:
+            return
+        self.n += 1
+        self.sum += x
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        self.sketch.add(x)
+        return
+
+    def merge(self, other):
+        # type: (GroupStats) -> None
+        """Merge statistics of another group into this one.
+
+        :param other: Statistics to merge
+        """
+        self.count += other.count
+        self.n += other.n
+        self.sum += other.sum
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        self.sketch.merge(other.sketch)
+        return
+
+    def quantile(self, q):
+        # type: (float) -> Optional[float]
+        """Get estimated quantile of values.
+
+        :param q: Quantile between 0 and 1
+        :returns: Estimated value, or None when there is no value
+        """
+        return self.sketch.quantile(q)
+
+
+class Aggregator(object):
+    """Aggregate records by groups in one pass.
+
+    Records are grouped by the values of group_by labels. Each item of
+    group_by is a label or a tuple of label and function to convert its
+    value, for example (b"time", lambda v: v[:16]) to group by minute.
+    Labels must be the same type as labels of records.
+
+    Values of value label are parsed as float. Values that cannot be
+    parsed, NaN and infinities are only counted as records.
+
+    Memory used is proportional to the number of groups, and each quantile
+    sketch has a bounded number of buckets. Statistics of separate
+    aggregators can be combined by merge, for example after pickling
+    groups in other processes.
+    """
+
+    def __init__(
+        self,
+        group_by=(),
+        value=None,
+        relative_accuracy=0.01,
+        max_buckets=2048,
+    ):
+        # type: (Sequence[Union[Any, Tuple[Any, Callable[[Any], Any]]]], Any, float, int) -> None
+        """Initialize.
+
+        :param group_by: Labels to group records by
+        :param value: Label of values to aggregate
+        :param relative_accuracy: Relative accuracy of estimated quantiles
+        :param max_buckets: Max number of buckets of quantile sketches
+        """
+        self._labels = []  # type: List[Any]
+        self._funcs = []  # type: List[Optional[Callable[[Any], Any]]]
+        for item in group_by:
+            if isinstance(item, tuple):
+                self._labels.append(item[0])
+                self._funcs.append(item[1])
+            else:
+                self._labels.append(item)
+                self._funcs.append(None)
+        self._value = value
+        self._relative_accuracy = relative_accuracy
+        self._max_buckets = max_buckets
+        self.groups = {}  # type: Dict[_GROUP_KEY, GroupStats]
+        return
+
+    def add(self, record):
+        # type: (Iterable[Tuple[Any, Any]]) -> None
+        """Add one record.
+
+        :param record: Parsed record
+        """
+        fields = dict(record)
+        key = tuple(
+            [
+                fields.get(l) if f is None or l not in fields else f(fields[l])
+                for l, f in zip(self._labels, self._funcs)
+            ]
+        )
+        stats = self.groups.get(key)
+        if stats is None:
+            stats = GroupStats(self._relative_accuracy, self._max_buckets)
+            self.groups[key] = stats
+
+        x = None  # type: Optional[float]
+        if self._value is not None and self._value in fields:
+            try:
+                x = float(fields[self._value])
+            except ValueError:
+                pass
+        if x is not None and (math.isnan(x) or math.isinf(x)):
+            x = None
+        stats.add(x)
+        return
+
+    def add_records(self, records):
+        # type: (Iterable[Iterable[Tuple[Any, Any]]]) -> None
+        """Add records.
+
+        :param records: Iterable of parsed records
+        """
+        for record in records:
+            self.add(record)
+        return
+
+    def merge(self, groups):
+        # type: (Mapping[_GROUP_KEY, GroupStats]) -> None
+        """Merge groups aggregated separately.
+
+        :param groups: Groups of another aggregator
+        """
+        for key, other in groups.items():
+            stats = self.groups.get(key)
+            if stats is None:
+                stats = GroupStats(self._relative_accuracy, self._max_buckets)
+                self.groups[key] = stats
+            stats.merge(other)
+        return
+
+
+def aggregate(
+    records,
+    group_by=(),
+    value=None,
+    relative_accuracy=0.01,
+    max_buckets=2048,
+):
+    # type: (Iterable[Iterable[Tuple[Any, Any]]], Sequence[Union[Any, Tuple[Any, Callable[[Any], Any]]]], Any, float, int) -> Dict[_GROUP_KEY, GroupStats]
+    """Aggregate records by groups in one pass.
+
+    See Aggregator for details of parameters.
+
+    :param records: Iterable of parsed records, for example breader object
+    :param group_by: Labels to group records by
+    :param value: Label of values to aggregate
+    :param relative_accuracy: Relative accuracy of estimated quantiles
+    :param max_buckets: Max number of buckets of quantile sketches
+    :returns: Dict from tuple of group values to GroupStats object
+    """
+    aggregator = Aggregator(group_by, value, relative_accuracy, max_buckets)
+    aggregator.add_records(records)
+    return aggregator.groups
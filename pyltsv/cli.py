@@ -0,0 +1,333 @@
+"""Command-line interface of pyltsv."""
+
+import argparse
+import errno
+import io
+import os
+import sys
+
+from typing import Callable
+from typing import Dict
+from typing import IO
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Text
+from typing import Tuple
+
+from . import read
+from . import write
+
+# Buffer size used for stdin, stdout and input files
+_BUFFER_SIZE = 1024 * 1024
+
+# Exit status used when stdout is closed by the reader, like processes
+# killed by SIGPIPE
+_EXIT_BROKEN_PIPE = 128 + 13
+
+
+def main(argv=None, stdin=None, stdout=None, stderr=None):
+    # type: (Optional[Sequence[str]], Optional[IO[bytes]], Optional[IO[bytes]], Optional[IO[Text]]) -> int
+    """Run pyltsv command.
+
+    :param argv: Command-line arguments without program name
+    :param stdin: Binary file-like object used for input "-"
+    :param stdout: Binary file-like object to write output
+    :param stderr: Text file-like object to write error messages
+    :returns: Exit status
+    """
+    args = _build_argparser().parse_args(argv)
+    if stdin is None:
+        stdin = _open_std(sys.stdin, "rb")
+    if stdout is None:
+        stdout = _open_std(sys.stdout, "wb")
+    if stderr is None:
+        stderr = sys.stderr
+
+    try:
+        ret = args.func(
+            args, _iter_inputs(args.files, stdin), stdout, stderr
+        )  # type: int
+        stdout.flush()
+    except (IOError, OSError) as e:
+        # BrokenPipeError is a subclass of OSError
+        if e.errno == errno.EPIPE:
+            _discard_stdout()
+            return _EXIT_BROKEN_PIPE
+        stderr.write(u"pyltsv: {}\n".format(e))
+        return 1
+    return ret
+
+
+def _build_argparser():
+    # type: () -> argparse.ArgumentParser
+    """Build parser for command-line arguments.
+
+    :returns: ArgumentParser object
+    """
+    parser = argparse.ArgumentParser(prog="pyltsv", description="Process LTSV files.")
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    subparsers.required = True
+
+    def add_command(name, func, help_):
+        # type: (str, Callable[..., int], str) -> argparse.ArgumentParser
+        p = subparsers.add_parser(name, help=help_, description=help_)
+        p.set_defaults(func=func)
+        return p
+
+    p = add_command("cut", _cmd_cut, "Output only the given labels.")
+    p.add_argument(
+        "-l",
+        "--labels",
+        required=True,
+        help="Comma separated list of labels to output",
+    )
+
+    p = add_command("grep", _cmd_grep, "Output records whose value matches pattern.")
+    p.add_argument(
+        "-v",
+        "--invert-match",
+        action="store_true",
+        help="Output records that do not match",
+    )
+    p.add_argument("expression", metavar="LABEL=PATTERN", help="Regular expression")
+
+    add_command("to-json", _cmd_to_json, "Convert LTSV into JSON Lines.")
+    add_command("from-json", _cmd_from_json, "Convert JSON Lines into LTSV.")
+    add_command("stats", _cmd_stats, "Count records and labels.")
+
+    p = add_command("validate", _cmd_validate, "Check that input can be parsed.")
+    p.add_argument(
+        "--strict", action="store_true", help="Validate input strictly following spec"
+    )
+
+    for p in subparsers.choices.values():
+        p.add_argument(
+            "files", metavar="FILE", nargs="*", help="Input files (default: stdin)"
+        )
+    return parser
+
+
+def _open_std(stream, mode):
+    # type: (IO[str], str) -> IO[bytes]
+    """Open standard stream as large-buffered binary file object.
+
+    :param stream: sys.stdin or sys.stdout
+    :param mode: "rb" or "wb"
+    :returns: Binary file-like object
+    """
+    try:
+        fd = stream.fileno()
+    except (AttributeError, IOError, ValueError):  # pragma: no cover
+        return getattr(stream, "buffer", stream)  # type: ignore
+    return io.open(fd, mode, buffering=_BUFFER_SIZE, closefd=False)
+
+
+def _discard_stdout():
+    # type: () -> None
+    """Redirect stdout to devnull so that flushing at exit does not fail."""
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    except (AttributeError, IOError, OSError, ValueError):  # pragma: no cover
+        pass
+    return
+
+
+def _iter_inputs(files, stdin):
+    # type: (List[str], IO[bytes]) -> Iterator[Tuple[str, IO[bytes]]]
+    """Open input files one by one.
+
+    :param files: Input file names, "-" for stdin
+    :param stdin: Binary file-like object used for "-"
+    :yields: Tuple of file name and binary file-like object
+    """
+    for name in files or ["-"]:
+        if name == "-":
+            yield name, stdin
+            continue
+        with io.open(name, "rb", buffering=_BUFFER_SIZE) as f:
+            yield name, f
+    return
+
+
+def _to_bytes(s):
+    # type: (str) -> bytes
+    """Convert command-line argument into bytes.
+
+    :param s: Command-line argument
+    :returns: Encoded argument
+    """
+    if isinstance(s, bytes):  # Python2  # pragma: no cover
+        return s
+    return os.fsencode(s)
+
+
+def _cmd_cut(args, inputs, stdout, stderr):
+    # type: (argparse.Namespace, Iterator[Tuple[str, IO[bytes]]], IO[bytes], IO[Text]) -> int
+    """Run cut command.
+
+    :param args: Parsed arguments
+    :param inputs: Input files
+    :param stdout: Output file
+    :param stderr: Error output
+    :returns: Exit status
+    """
+    labels = frozenset(_to_bytes(l) for l in args.labels.split(","))
+    w = write.bwriter(stdout)
+    for _, f in inputs:
+        for record in read.breader(f):
+            w.writerow([(l, v) for l, v in record if l in labels])
+    return 0
+
+
+def _cmd_grep(args, inputs, stdout, stderr):
+    # type: (argparse.Namespace, Iterator[Tuple[str, IO[bytes]]], IO[bytes], IO[Text]) -> int
+    """Run grep command.
+
+    Exit status is 0 when any record is selected, otherwise 1.
+
+    :param args: Parsed arguments
+    :param inputs: Input files
+    :param stdout: Output file
+    :param stderr: Error output
+    :returns: Exit status
+    """
+    import re
+
+    label, sep, pattern = _to_bytes(args.expression).partition(b"=")
+    if not sep:
+        stderr.write(u"pyltsv: expression must be LABEL=PATTERN\n")
+        return 2
+    try:
+        search = re.compile(pattern).search
+    except re.error as e:
+        stderr.write(u"pyltsv: invalid pattern: {}\n".format(e))
+        return 2
+    invert = args.invert_match
+    selected = False
+    w = write.bwriter(stdout)
+    for _, f in inputs:
+        for record in read.breader(f):
+            matched = False
+            for l, v in record:
+                if l == label and search(v) is not None:
+                    matched = True
+                    break
+            if matched != invert:
+                selected = True
+                w.writerow(record)
+    return 0 if selected else 1
+
+
+def _cmd_to_json(args, inputs, stdout, stderr):
+    # type: (argparse.Namespace, Iterator[Tuple[str, IO[bytes]]], IO[bytes], IO[Text]) -> int
+    """Run to-json command.
+
+    Labels and values are decoded as UTF-8, replacing undecodable bytes.
+
+    :param args: Parsed arguments
+    :param inputs: Input files
+    :param stdout: Output file
+    :param stderr: Error output
+    :returns: Exit status
+    """
+    from . import convert
+
+    for _, f in inputs:
+        convert.ltsv_to_jsonl(f, stdout, errors="replace")
+    return 0
+
+
+def _cmd_from_json(args, inputs, stdout, stderr):
+    # type: (argparse.Namespace, Iterator[Tuple[str, IO[bytes]]], IO[bytes], IO[Text]) -> int
+    """Run from-json command.
+
+    Non-string values are written in their JSON representation, and null
+    values are written as empty values.
+
+    :param args: Parsed arguments
+    :param inputs: Input files
+    :param stdout: Output file
+    :param stderr: Error output
+    :returns: Exit status
+    """
+    from . import convert
+
+    for name, f in inputs:
+        try:
+            convert.jsonl_to_ltsv(f, stdout)
+        except convert.ConvertError as e:
+            stderr.write(u"pyltsv: {}:{}: {}\n".format(name, e.lineno, e.msg))
+            return 1
+    return 0
+
+
+def _cmd_stats(args, inputs, stdout, stderr):
+    # type: (argparse.Namespace, Iterator[Tuple[str, IO[bytes]]], IO[bytes], IO[Text]) -> int
+    """Run stats command.
+
+    The first output line has the number of records and fields, followed by
+    one line per label in the order they first appeared.
+
+    :param args: Parsed arguments
+    :param inputs: Input files
+    :param stdout: Output file
+    :param stderr: Error output
+    :returns: Exit status
+    """
+    records = 0
+    fields = 0
+    labels = {}  # type: Dict[bytes, int]
+    order = []  # type: List[bytes]
+    for _, f in inputs:
+        for record in read.breader(f):
+            records += 1
+            for l, _ in record:
+                fields += 1
+                if l in labels:
+                    labels[l] += 1
+                else:
+                    labels[l] = 1
+                    order.append(l)
+
+    w = write.bwriter(stdout)
+    w.writerow(
+        [
+            (b"records", str(records).encode("ascii")),
+            (b"fields", str(fields).encode("ascii")),
+        ]
+    )
+    for l in order:
+        w.writerow([(b"label", l), (b"count", str(labels[l]).encode("ascii"))])
+    return 0
+
+
+def _cmd_validate(args, inputs, stdout, stderr):
+    # type: (argparse.Namespace, Iterator[Tuple[str, IO[bytes]]], IO[bytes], IO[Text]) -> int
+    """Run validate command.
+
+    Every invalid line is reported to stderr.
+
+    :param args: Parsed arguments
+    :param inputs: Input files
+    :param stdout: Output file
+    :param stderr: Error output
+    :returns: Exit status
+    """
+    errors = 0
+    for name, f in inputs:
+        r = read.breader(f, strict=args.strict)
+        lineno = 0
+        while True:
+            lineno += 1
+            try:
+                record = r.readline()
+            except read.BaseLineParser.ParseError as e:
+                errors += 1
+                stderr.write(u"pyltsv: {}:{}: {}\n".format(name, lineno, e.args[0]))
+                continue
+            if record is None:
+                break
+    return 1 if errors else 0
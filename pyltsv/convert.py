@@ -0,0 +1,342 @@
+"""Convert LTSV from and into JSON Lines and CSV."""
+
+import csv
+import itertools
+import json
+import re
+
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Text
+from typing import Tuple
+
+import six
+
+from .read import BytesLineParser
+from .write import BytesLineFormatter
+from .write import BytesWriter
+
+DEFAULT_BATCH_SIZE = 1024
+DEFAULT_SAMPLE_SIZE = 1024
+
+# Uses C implementation when available
+_encode_json_str = json.encoder.encode_basestring  # type: Callable[[Text], str]
+
+# Chars that would break fields or lines of LTSV output
+_invalid_label_re = re.compile(b"[\t\n\r:]")
+_invalid_value_re = re.compile(b"[\t\n\r]")
+
+
+class ConvertError(ValueError):
+    """Error was found in input while converting."""
+
+    def __init__(self, msg, lineno, input_):
+        # type: (Text, int, object) -> None
+        """Initialize.
+
+        :param msg: Error message
+        :param lineno: Line number of the input, starting from 1
+        :param input_: Input line or row
+        """
+        super(ConvertError, self).__init__(msg, lineno, input_)
+        self.msg = msg
+        self.lineno = lineno
+        self.input = input_
+        return
+
+    def __str__(self):
+        # type: () -> str
+        """Get error message with line number.
+
+        :returns: Error message
+        """
+        return "{}: {}".format(self.lineno, self.msg)
+
+
+def ltsv_to_jsonl(
+    ltsvfile,
+    jsonlfile,
+    strict=False,
+    encoding="utf-8",
+    errors="strict",
+    batch_size=DEFAULT_BATCH_SIZE,
+):
+    # type: (IO[bytes], IO[bytes], bool, str, str, int) -> int
+    """Convert LTSV into JSON Lines.
+
+    Every record is written as one JSON object whose members keep the order
+    of fields. Duplicate labels are written as they are.
+
+    :param ltsvfile: Binary file-like object to read LTSV
+    :param jsonlfile: Binary file-like object to write JSON Lines
+    :param strict: Enable strict parsing
+    :param encoding: Encoding of LTSV input and JSON output
+    :param errors: Error handling scheme used to decode LTSV input
+    :param batch_size: The number of lines to convert at once
+    :returns: The number of records converted
+    """
+    parse = BytesLineParser(strict).parse
+    enc = _encode_json_str
+    total = 0
+    for lines in _iter_batches(ltsvfile, batch_size):
+        out = []  # type: List[Text]
+        for line in lines:
+            out.append(
+                u"{"
+                + u",".join(
+                    enc(l.decode(encoding, errors))
+                    + u":"
+                    + enc(v.decode(encoding, errors))
+                    for l, v in parse(line)
+                )
+                + u"}\n"
+            )
+        jsonlfile.write(u"".join(out).encode(encoding))
+        total += len(lines)
+    return total
+
+
+def jsonl_to_ltsv(
+    jsonlfile,
+    ltsvfile,
+    strict=False,
+    encoding="utf-8",
+    batch_size=DEFAULT_BATCH_SIZE,
+):
+    # type: (IO[bytes], IO[bytes], bool, str, int) -> int
+    """Convert JSON Lines into LTSV.
+
+    Each line must be one JSON object. Non-string values are written in
+    their JSON representation and null values are written as empty
+    values. Blank lines are skipped.
+
+    :param jsonlfile: Binary file-like object to read JSON Lines
+    :param ltsvfile: Binary file-like object to write LTSV
+    :param strict: Enable strict formatting
+    :param encoding: Encoding of JSON input and LTSV output
+    :param batch_size: The number of lines to convert at once
+    :returns: The number of records converted
+    :raises ConvertError: Input line is not a JSON object, or has a label or
+        value that cannot be written as LTSV
+    """
+    decode = json.JSONDecoder(object_pairs_hook=OrderedDict).decode
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    text_type = six.text_type
+    writer = BytesWriter(ltsvfile, BytesLineFormatter(strict))
+    lineno = 0
+    total = 0
+    for lines in _iter_batches(jsonlfile, batch_size):
+        rows = []  # type: List[Mapping[bytes, Optional[bytes]]]
+        for line in lines:
+            lineno += 1
+            if not line.strip():
+                continue
+            try:
+                obj = decode(line.decode(encoding))
+            except ValueError as e:
+                # UnicodeDecodeError is a subclass of ValueError
+                raise ConvertError(u"{}".format(e), lineno, line)
+            if not isinstance(obj, dict):
+                raise ConvertError(u"JSON object expected", lineno, line)
+            row = OrderedDict()  # type: OrderedDict[bytes, Optional[bytes]]
+            for k, v in obj.items():
+                if v is None:
+                    row[k.encode(encoding)] = None
+                elif isinstance(v, text_type):
+                    row[k.encode(encoding)] = v.encode(encoding)
+                else:
+                    row[k.encode(encoding)] = encode(v).encode(encoding)
+            _check_row(list(row.items()), lineno, line)
+            rows.append(row)
+        writer.writerows(rows)
+        total += len(rows)
+    return total
+
+
+def ltsv_to_csv(
+    ltsvfile,
+    csvfile,
+    labels=None,
+    sample_size=DEFAULT_SAMPLE_SIZE,
+    strict=False,
+    encoding="utf-8",
+    errors="strict",
+    batch_size=DEFAULT_BATCH_SIZE,
+    **fmtparams
+):
+    # type: (IO[bytes], IO[Any], Optional[Sequence[bytes]], int, bool, str, str, int, Any) -> int
+    """Convert LTSV into CSV.
+
+    When labels is not given, CSV header is discovered from the first
+    sample_size lines and labels that first appear after them are
+    dropped. Missing labels are written as empty cells, and the last value
+    is used when a label appears more than once in a record.
+
+    In Python 3 csvfile must be a text file opened with newline="". In
+    Python 2 csvfile must be a binary file and values are written without
+    decoding.
+
+    :param ltsvfile: Binary file-like object to read LTSV
+    :param csvfile: File-like object to write CSV
+    :param labels: Labels to write as CSV columns
+    :param sample_size: The number of lines used to discover labels
+    :param strict: Enable strict parsing
+    :param encoding: Encoding of LTSV input
+    :param errors: Error handling scheme used to decode LTSV input
+    :param batch_size: The number of lines to convert at once
+    :param fmtparams: Formatting parameters passed to csv.writer
+    :returns: The number of records converted
+    """
+    parse = BytesLineParser(strict).parse
+    decode = _get_decoder(encoding, errors)
+    lines_iter = iter(ltsvfile)  # type: Iterator[bytes]
+    if labels is None:
+        sample = list(itertools.islice(lines_iter, sample_size))
+        seen = OrderedDict()  # type: OrderedDict[bytes, None]
+        for line in sample:
+            for l, _ in parse(line):
+                seen[l] = None
+        labels = list(seen)
+        lines_iter = itertools.chain(sample, lines_iter)
+
+    w = csv.writer(csvfile, **fmtparams)
+    w.writerow([decode(l) for l in labels])
+    empty = decode(b"")
+    total = 0
+    for lines in _iter_batches(lines_iter, batch_size):
+        rows = []  # type: List[List[Any]]
+        for line in lines:
+            record = dict(parse(line))
+            rows.append([decode(record[l]) if l in record else empty for l in labels])
+        w.writerows(rows)
+        total += len(rows)
+    return total
+
+
+def csv_to_ltsv(
+    csvfile,
+    ltsvfile,
+    labels=None,
+    strict=False,
+    encoding="utf-8",
+    batch_size=DEFAULT_BATCH_SIZE,
+    **fmtparams
+):
+    # type: (IO[Any], IO[bytes], Optional[Sequence[bytes]], bool, str, int, Any) -> int
+    """Convert CSV into LTSV.
+
+    When labels is not given, the first row of CSV is used as labels.
+    Extra cells without labels are dropped.
+
+    In Python 3 csvfile must be a text file opened with newline="". In
+    Python 2 csvfile must be a binary file and values are written without
+    encoding.
+
+    :param csvfile: File-like object to read CSV
+    :param ltsvfile: Binary file-like object to write LTSV
+    :param labels: Labels of CSV columns
+    :param strict: Enable strict formatting
+    :param encoding: Encoding of LTSV output
+    :param batch_size: The number of rows to convert at once
+    :param fmtparams: Formatting parameters passed to csv.reader
+    :returns: The number of records converted
+    :raises ConvertError: Input has a label or value that cannot be written
+        as LTSV
+    """
+    encode = _get_encoder(encoding)
+    r = csv.reader(csvfile, **fmtparams)
+    # Row number of CSV input, starting from 1
+    rowno = 0
+    if labels is None:
+        labels = [encode(l) for l in next(r, [])]
+        rowno += 1
+    writer = BytesWriter(ltsvfile, BytesLineFormatter(strict))
+    total = 0
+    for rows in _iter_batches(r, batch_size):
+        records = []  # type: List[List[Tuple[bytes, Optional[bytes]]]]
+        for row in rows:
+            rowno += 1
+            record = list(
+                zip(labels, map(encode, row))
+            )  # type: List[Tuple[bytes, Optional[bytes]]]
+            _check_row(record, rowno, row)
+            records.append(record)
+        writer.writerows(records)
+        total += len(rows)
+    return total
+
+
+def _check_row(row, lineno, input_):
+    # type: (List[Tuple[bytes, Optional[bytes]]], int, object) -> None
+    """Check that row can be written as LTSV without breaking fields.
+
+    :param row: Labels and values to write
+    :param lineno: Line or row number of the input
+    :param input_: Input line or row, used for error messages
+    :raises ConvertError: Invalid label or value found
+    """
+    # Check all labels and values at once, since invalid ones are rare
+    if (
+        _invalid_label_re.search(b"".join([l for l, _ in row])) is None
+        and _invalid_value_re.search(b"".join([v for _, v in row if v])) is None
+    ):
+        return
+    for l, v in row:
+        if _invalid_label_re.search(l) is not None:
+            raise ConvertError(
+                u"Invalid char found in label: {!r}".format(l), lineno, input_
+            )
+        if v and _invalid_value_re.search(v) is not None:
+            raise ConvertError(
+                u"Invalid char found in value: {!r}".format(v), lineno, input_
+            )
+    return
+
+
+def _iter_batches(iterable, batch_size):
+    # type: (Iterable[Any], int) -> Iterator[List[Any]]
+    """Split iterable into lists of at most batch_size items.
+
+    :param iterable: Input iterable
+    :param batch_size: Max length of each list
+    :yields: List of items
+    """
+    it = iter(iterable)
+    while True:
+        batch = list(itertools.islice(it, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _get_decoder(encoding, errors):
+    # type: (str, str) -> Callable[[bytes], Any]
+    """Get function to convert LTSV bytes into csv module input.
+
+    :param encoding: Encoding of LTSV
+    :param errors: Error handling scheme
+    :returns: Decoder function
+    """
+    if six.PY2:  # pragma: no cover
+        return lambda b: b
+    return lambda b: b.decode(encoding, errors)
+
+
+def _get_encoder(encoding):
+    # type: (str) -> Callable[[Any], bytes]
+    """Get function to convert csv module output into LTSV bytes.
+
+    :param encoding: Encoding of LTSV
+    :returns: Encoder function
+    """
+    if six.PY2:  # pragma: no cover
+        return lambda s: s
+    return lambda s: s.encode(encoding)
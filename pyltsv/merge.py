@@ -0,0 +1,145 @@
+"""Merge LTSV files ordered by a label."""
+
+import heapq
+import io
+
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Text
+from typing import Tuple
+from typing import Union
+
+from .read import breader
+
+# Buffer size used for each input file
+DEFAULT_BUFFER_SIZE = 256 * 1024
+
+_RECORD = Iterable[Tuple[bytes, bytes]]
+
+
+class MergeError(ValueError):
+    """Error was found while merging LTSV input."""
+
+    def __init__(self, msg, path, record):
+        # type: (Text, str, _RECORD) -> None
+        """Initialize.
+
+        :param msg: Error message
+        :param path: Input file path
+        :param record: Parsed record
+        """
+        super(MergeError, self).__init__(msg, path, record)
+        self.path = path
+        self.record = record
+        return
+
+
+class KeyNotFoundError(MergeError):
+    """Key label was not found in record."""
+
+
+class OutOfOrderError(MergeError):
+    """Record was found out of order."""
+
+
+def merge_readers(
+    paths,
+    key="time",
+    keyfunc=None,
+    window=None,
+    check=True,
+    strict=False,
+    buffering=DEFAULT_BUFFER_SIZE,
+):
+    # type: (Iterable[str], Union[bytes, Text], Optional[Callable[[bytes], Any]], Any, bool, bool, int) -> Iterator[_RECORD]
+    """Merge LTSV files each ordered by a label into one sequence.
+
+    Files are read in parallel through breader and only one record per
+    file is kept in memory, plus records within window. Records with the
+    same key are returned in the order of paths. Empty records are skipped.
+
+    When window is given, records of each file are reordered as long as
+    they are out of order by less than window. keyfunc must return
+    numbers then, for example by using float to parse unix time.
+
+    :param paths: Input file paths
+    :param key: Label to order records by
+    :param keyfunc: Function to convert key value into comparable object
+    :param window: Tolerated disorder of key in each file
+    :param check: Raise error when records are found out of order
+    :param strict: Enable strict parsing
+    :param buffering: Buffer size of each input file
+    :returns: Iterator of parsed records
+    """
+    if not isinstance(key, bytes):
+        key = key.encode("ascii")
+    sources = [
+        _iter_keyed(path, i, key, keyfunc, window, check, strict, buffering)
+        for i, path in enumerate(paths)
+    ]
+    for item in heapq.merge(*sources):
+        yield item[3]
+    return
+
+
+def _iter_keyed(path, index, key, keyfunc, window, check, strict, buffering):
+    # type: (str, int, bytes, Optional[Callable[[bytes], Any]], Any, bool, bool, int) -> Iterator[Tuple[Any, int, int, _RECORD]]
+    """Read records of one file with their parsed keys.
+
+    :param path: Input file path
+    :param index: Index of the file, used to break ties
+    :param key: Label to order records by
+    :param keyfunc: Function to convert key value into comparable object
+    :param window: Tolerated disorder of key
+    :param check: Raise error when records are found out of order
+    :param strict: Enable strict parsing
+    :param buffering: Buffer size of input file
+    :yields: Tuple of key, index, record number and record
+    :raises KeyNotFoundError: Key label was not found in record
+    :raises OutOfOrderError: Record was found out of order
+    """
+    # The last key, or the largest key when window is given
+    last = None  # type: Any
+    # Heap of records within window
+    pending = []  # type: List[Tuple[Any, int, int, _RECORD]]
+    with io.open(path, "rb", buffering=buffering) as f:
+        for seq, record in enumerate(breader(f, strict=strict)):
+            if not record:
+                continue
+            for l, v in record:
+                if l == key:
+                    k = v if keyfunc is None else keyfunc(v)
+                    break
+            else:
+                raise KeyNotFoundError(
+                    u"Key label not found: {!r}".format(key), path, record
+                )
+
+            if window is None:
+                if check and last is not None and k < last:
+                    raise OutOfOrderError(
+                        u"Record out of order: {!r}".format(k), path, record
+                    )
+                last = k
+                yield (k, index, seq, record)
+                continue
+
+            if last is None or k > last:
+                last = k
+            elif check and k < last - window:
+                raise OutOfOrderError(
+                    u"Record out of order beyond window: {!r}".format(k), path, record
+                )
+            heapq.heappush(pending, (k, index, seq, record))
+            # Following records are expected to be not less than
+            # last - window, so records up to it can be released
+            limit = last - window
+            while pending and pending[0][0] <= limit:
+                yield heapq.heappop(pending)
+    while pending:
+        yield heapq.heappop(pending)
+    return
@@ -1,17 +1,29 @@
 """LTSV reader."""
 
+import re
 import string
 
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
 from typing import ClassVar
+from typing import Dict
 from typing import FrozenSet
 from typing import Generic
 from typing import IO
 from typing import Iterable
+from typing import List
+from typing import Match
 from typing import Optional
+from typing import Pattern
+from typing import Set
 from typing import Text
 from typing import Tuple
 from typing import TypeVar
 from typing import Union
+from typing import overload
+
+from six.moves import _thread
 
 
 def reader(ltsvfile, strict=False, delimiter=None, labeldelimiter=None):
@@ -27,17 +39,65 @@ def reader(ltsvfile, strict=False, delimiter=None, labeldelimiter=None):
     return StrReader(ltsvfile, StrLineParser(strict, delimiter, labeldelimiter))
 
 
+@overload
 def breader(ltsvfile, strict=False, delimiter=None, labeldelimiter=None):
     # type: (IO[bytes], bool, Optional[bytes], Optional[bytes]) -> BytesReader
+    pass  # pragma: no cover
+
+
+@overload
+def breader(
+    ltsvfile,
+    strict=False,
+    delimiter=None,
+    labeldelimiter=None,
+    decode=None,  # type: ignore[assignment]
+    errors="strict",
+    labels=None,  # type: ignore[assignment]
+):
+    # type: (IO[bytes], bool, Optional[bytes], Optional[bytes], str, str, Iterable[Text]) -> DecodingBytesReader
+    pass  # pragma: no cover
+
+
+def breader(
+    ltsvfile,
+    strict=False,
+    delimiter=None,
+    labeldelimiter=None,
+    decode=None,
+    errors="strict",
+    labels=None,
+):
+    # type: (IO[bytes], bool, Optional[bytes], Optional[bytes], Optional[str], str, Optional[Iterable[Text]]) -> Union[BytesReader, DecodingBytesReader]
     """Get LTSV reader for bytes.
 
+    When decode and labels are given, only fields of the labels are
+    returned, and their labels and values are decoded into unicode str.
+    Values of other fields are not decoded, and lines sharing labels with
+    recent lines are matched by a regex capturing only returned values,
+    which is faster than reading through io.TextIOWrapper with reader and
+    filtering fields. To decode whole lines, use io.TextIOWrapper with
+    reader.
+
     :param ltsvfile: File-like object to read input
     :param strict: Enable strict parsing
     :param delimiter: Set custom field delimiter
     :param labeldelimiter: Set custom label delimiter
-    :returns: BytesReader object
+    :param decode: Encoding used to decode labels and values
+    :param errors: Error handling scheme used with decode
+    :param labels: Return only fields of these labels, used with decode
+    :returns: BytesReader object, or DecodingBytesReader object when
+        decode and labels are given
+    :raises ParserConfigError: Only one of decode and labels is given
     """
-    return BytesReader(ltsvfile, BytesLineParser(strict, delimiter, labeldelimiter))
+    parser = BytesLineParser(strict, delimiter, labeldelimiter)
+    if decode is None and labels is None:
+        return BytesReader(ltsvfile, parser)
+    if decode is None or labels is None:
+        raise BaseLineParser.ParserConfigError(
+            "decode and labels must be given together"
+        )
+    return DecodingBytesReader(ltsvfile, parser, decode, labels, errors)
 
 
 T = TypeVar("T", Text, bytes)
@@ -99,6 +159,342 @@ class BytesReader(BaseReader[bytes]):
     """LTSV reader for bytes."""
 
 
+class DecodingBytesReader(object):
+    """LTSV reader for bytes that returns fields of given labels in unicode str."""
+
+    # Max number of decoded labels to remember
+    _label_cache_size = 4096
+
+    def __init__(self, ltsvfile, parser, encoding, labels, errors="strict"):
+        # type: (IO[bytes], BaseLineParser[bytes], str, Iterable[Text], str) -> None
+        """Initialize.
+
+        :param ltsvfile: File-like object to read input
+        :param parser: BaseLineParser object
+        :param encoding: Encoding used to decode labels and values
+        :param labels: Return only fields of these labels
+        :param errors: Error handling scheme used to decode
+        """
+        self._ltsvfile = ltsvfile  # type: IO[bytes]
+        self._parser = parser  # type: BaseLineParser[bytes]
+        self._encoding = encoding  # type: str
+        self._errors = errors  # type: str
+        self._labels = frozenset(
+            [l.encode(encoding) for l in labels]
+        )  # type: FrozenSet[bytes]
+        self._decoded_labels = {}  # type: Dict[bytes, Text]
+        # Map from labels of a line to its projection, a tuple of decoded
+        # labels of returned fields and a function matching their values
+        self._projections = (
+            {}
+        )  # type: Dict[Tuple[bytes, ...], Tuple[Tuple[Text, ...], Callable[[bytes], Optional[Match[bytes]]]]]
+        # Labels of lines read without projection
+        self._seen_labels = set()  # type: Set[Tuple[bytes, ...]]
+        # Projections used last and before that
+        self._last = (
+            (),
+            _never_match,
+        )  # type: Tuple[Tuple[Text, ...], Callable[[bytes], Optional[Match[bytes]]]]
+        self._prev = (
+            self._last
+        )  # type: Tuple[Tuple[Text, ...], Callable[[bytes], Optional[Match[bytes]]]]
+        return
+
+    def __iter__(self):
+        # type: () -> DecodingBytesReader
+        """Get iter object.
+
+        :returns: Iter object
+        """
+        return self
+
+    def __next__(self):
+        # type: () -> Iterable[Tuple[Text, Text]]
+        """Return next element.
+
+        :returns: Parsed object
+        :raises StopIteration: EOF
+        """
+        r = self.readline()
+        if r is None:
+            raise StopIteration
+        return r
+
+    next = __next__  # For Python 2.7 compatibility
+
+    def readline(self):
+        # type: () -> Optional[Iterable[Tuple[Text, Text]]]
+        """Read one line and return parsed object.
+
+        Lines are matched against regexes of the two projections used
+        last, which extract only values of returned fields.
+
+        :returns: parsed object or None for EOF
+        """
+        line = self._ltsvfile.readline()
+        if len(line) == 0:
+            return None
+        labels, match = self._last
+        m = match(line)
+        if m is None:
+            labels, match = self._prev
+            m = match(line)
+            if m is None:
+                return self._read_fields(line)
+            self._last, self._prev = self._prev, self._last
+        encoding = self._encoding
+        errors = self._errors
+        return list(zip(labels, [v.decode(encoding, errors) for v in m.groups()]))
+
+    def _read_fields(self, line):
+        # type: (bytes) -> List[Tuple[Text, Text]]
+        """Parse line and decode fields of given labels.
+
+        :param line: Line to parse
+        :returns: Parsed object
+        """
+        encoding = self._encoding
+        errors = self._errors
+        wanted = self._labels
+        fields = self._parser.parse(line)
+        key = tuple([l for l, _ in fields])
+        r = [(l, v.decode(encoding, errors)) for l, v in fields if l in wanted]
+        projection = self._projections.get(key)
+        if projection is None:
+            seen = self._seen_labels
+            if key not in seen:
+                # Projections are created only for labels seen before
+                if len(seen) >= 4 * self._parser.layout_cache_size:
+                    seen.clear()
+                seen.add(key)
+                decoded_labels = self._decoded_labels
+                return [
+                    (decoded_labels.get(l) or self._decode_label(l), v) for l, v in r
+                ]
+            projection = self._get_projection(key)
+        self._last, self._prev = projection, self._last
+        return list(zip(projection[0], [v for _, v in r]))
+
+    def _get_projection(self, key):
+        # type: (Tuple[bytes, ...]) -> Tuple[Tuple[Text, ...], Callable[[bytes], Optional[Match[bytes]]]]
+        """Create projection of labels.
+
+        :param key: Labels of a line
+        :returns: Projection
+        """
+        projections = self._projections
+        if len(projections) >= self._parser.layout_cache_size:
+            projections.clear()
+        wanted = self._labels
+        labeldelimiter = self._parser.labeldelimiter
+        projection = (
+            tuple([self._decode_label(l) for l in key if l in wanted]),
+            self._parser._compile_matcher(
+                [l + labeldelimiter for l in key], [l in wanted for l in key]
+            ),
+        )
+        projections[key] = projection
+        return projection
+
+    def _decode_label(self, label):
+        # type: (bytes) -> Text
+        """Decode label once per distinct label.
+
+        :param label: Label to decode
+        :returns: Decoded label
+        """
+        decoded_labels = self._decoded_labels
+        r = decoded_labels.get(label)
+        if r is None:
+            r = label.decode(self._encoding, self._errors)
+            if len(decoded_labels) >= self._label_cache_size:
+                decoded_labels.clear()
+            decoded_labels[label] = r
+        return r
+
+
+class IncrementalParser(Generic[T]):
+    """Push-style LTSV parser for input given in arbitrary chunks."""
+
+    def __init__(self, parser):
+        # type: (BaseLineParser[T]) -> None
+        """Initialize.
+
+        Lines are split at any of eols of the parser.
+
+        :param parser: BaseLineParser object
+        """
+        self._parser = parser  # type: BaseLineParser[T]
+        self._empty = parser._empty_value  # type: T
+        # Drop eols that end with another eol when no eol occurs before that
+        # end: splitting at the shorter one also finds them, and the parser
+        # strips the longer one
+        eols = parser.eols
+        seps = [
+            eol
+            for eol in eols
+            if not any(o != eol and eol.endswith(o) for o in eols)
+            or any(o in eol[:-1] for o in eols if o != eol)
+        ]
+        # Longer separators are tried first
+        seps.sort(key=len, reverse=True)
+        self._seps = seps  # type: List[T]
+        self._sep = seps[0] if len(seps) == 1 else None  # type: Optional[T]
+        bar = u"|" if isinstance(self._empty, Text) else b"|"  # type: T
+        self._sep_re = re.compile(
+            bar.join([re.escape(sep) for sep in seps])
+        )  # type: Pattern[T]
+        # Separators can span chunks only when longer than one char
+        self._overlap = max(len(sep) for sep in seps) - 1  # type: int
+        # Chunks of the current incomplete line
+        self._pending = []  # type: List[T]
+        return
+
+    def feed(self, data):
+        # type: (T) -> List[Iterable[Tuple[T, T]]]
+        """Feed a chunk of input and parse lines completed by it.
+
+        :param data: Chunk of input
+        :returns: List of parsed objects
+        """
+        if len(data) == 0:
+            return []
+        if self._overlap == 0 and self._sep is not None:
+            return self._feed_single(data, self._sep)
+
+        pending = self._pending
+        tail = self._empty
+        if self._overlap and pending:
+            # Only the last chars of pending data can start a separator
+            i = len(pending)
+            while i > 0 and len(tail) < self._overlap:
+                i -= 1
+                tail = pending[i] + tail
+            tail = tail[-self._overlap :]
+        buf = tail + data
+        offset = len(tail)
+
+        parse = self._parser.parse
+        r = []  # type: List[Iterable[Tuple[T, T]]]
+        start = 0
+        prev = 0
+        # Matches starting in the last chars may change with the next chunk
+        limit = len(buf) - self._overlap
+        for m in self._sep_re.finditer(buf):
+            if m.start() >= limit and self._is_partial(buf, prev, m):
+                break
+            prev = m.end()
+            end = prev - offset
+            if end < 0:
+                # The line ends in pending data held back by the last feed
+                line = self._empty.join(pending)
+                pending = [line[end:]]
+                line = line[:end]
+                end = 0
+            elif pending:
+                pending.append(data[start:end])
+                line = self._empty.join(pending)
+                pending = []
+            else:
+                line = data[start:end]
+            r.append(parse(line))
+            start = end
+        if start < len(data):
+            pending.append(data[start:])
+        self._pending = pending
+        return r
+
+    def _is_partial(self, buf, start, m):
+        # type: (T, int, Match[T]) -> bool
+        """Return True when a longer separator may match with more input.
+
+        :param buf: Input being split
+        :param start: Position in buf after the previous separator
+        :param m: Match of a separator near the end of buf
+        :returns: True if the match should be held back
+        """
+        for i in range(max(start, len(buf) - self._overlap), m.start() + 1):
+            rest = buf[i:]
+            for sep in self._seps:
+                if len(sep) > len(rest) and sep.startswith(rest):
+                    return True
+        return False
+
+    def _feed_single(self, data, sep):
+        # type: (T, T) -> List[Iterable[Tuple[T, T]]]
+        """Feed a chunk of input with one single-char separator.
+
+        :param data: Chunk of input
+        :param sep: Line separator
+        :returns: List of parsed objects
+        """
+        parts = data.split(sep)
+        if len(parts) == 1:
+            self._pending.append(data)
+            return []
+        if self._pending:
+            self._pending.append(parts[0])
+            parts[0] = self._empty.join(self._pending)
+        last = parts.pop()
+        self._pending = [last] if len(last) else []
+        parse = self._parser.parse
+        return [parse(part + sep) for part in parts]
+
+    def close(self):
+        # type: () -> List[Iterable[Tuple[T, T]]]
+        """Parse remaining input that was not terminated by eol.
+
+        :returns: List of parsed objects
+        """
+        if not self._pending:
+            return []
+        data = self._empty.join(self._pending)
+        self._pending = []
+        parse = self._parser.parse
+        r = []  # type: List[Iterable[Tuple[T, T]]]
+        start = 0
+        # Pending data may still hold separators held back by feed
+        for m in self._sep_re.finditer(data):
+            r.append(parse(data[start : m.end()]))
+            start = m.end()
+        if start < len(data):
+            r.append(parse(data[start:]))
+        return r
+
+
+def _never_match(line):
+    # type: (object) -> None
+    """Match nothing, used before any layout is used.
+
+    :param line: Line to match
+    :returns: None
+    """
+    return None
+
+
+def _chars(s):
+    # type: (T) -> List[T]
+    """Split str or bytes into chars of the same type.
+
+    :param s: Input
+    :returns: List of chars
+    """
+    return [s[i : i + 1] for i in range(len(s))]
+
+
+def _lit(empty, s):
+    # type: (T, Text) -> T
+    """Convert ASCII literal into the same type as empty.
+
+    :param empty: Empty str or bytes
+    :param s: Literal
+    :returns: Converted literal
+    """
+    if isinstance(empty, bytes):
+        return s.encode("ascii")
+    return s
+
+
 class BaseLineParser(Generic[T]):
     """Base LTSV line parser."""
 
@@ -108,6 +504,14 @@ class BaseLineParser(Generic[T]):
     eols = None  # type: Iterable[T]
     _empty_value = None  # type: T
 
+    # The number of label layouts to remember.
+    # Layouts are created for labels seen more than once. When labels of a
+    # line are the same as a recent layout, values are extracted without
+    # splitting labels. Labels are shared between records of a layout and
+    # validated only when the layout is created. Layouts are shared by all
+    # threads using the parser, and updated under a lock.
+    layout_cache_size = 16
+
     class ParserConfigError(ValueError):
         """Invalid parser configuration given."""
 
@@ -163,6 +567,90 @@ class BaseLineParser(Generic[T]):
             self.labeldelimiter = labeldelimiter
         if eols is not None:
             self.eols = eols
+
+        self._reset_parse()
+        return
+
+    # Attributes that parse function is specialized to
+    _config_attrs = frozenset(
+        ["strict", "delimiter", "labeldelimiter", "eols", "layout_cache_size"]
+    )
+
+    def __setattr__(self, name, value):
+        # type: (str, object) -> None
+        """Set attribute, specializing parse again when config is changed.
+
+        :param name: Attribute name
+        :param value: Attribute value
+        """
+        super(BaseLineParser, self).__setattr__(name, value)
+        if name in self._config_attrs and "_parse" in self.__dict__:
+            self._reset_parse()
+        return
+
+    def __getstate__(self):
+        # type: () -> Dict[str, object]
+        """Get state to pickle, without parse function and layouts.
+
+        :returns: State
+        """
+        state = dict(self.__dict__)
+        for name in (
+            "parse",
+            "_parse",
+            "_layouts",
+            "_recent_layouts",
+            "_matchers",
+            "_seen_labels",
+            "_last",
+            "_lock",
+        ):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        # type: (Dict[str, object]) -> None
+        """Restore pickled state.
+
+        :param state: State
+        """
+        self.__dict__.update(state)
+        self._reset_parse()
+        return
+
+    def _reset_parse(self):
+        # type: () -> None
+        """Forget label layouts and specialize parse to the current config."""
+        # Map from labels to layout, ordered from the least recently used one
+        # Layout is a tuple of labels, label prefixes and slices of values
+        self._layouts = (
+            OrderedDict()
+        )  # type: OrderedDict[Tuple[T, ...], Tuple[Tuple[T, ...], Tuple[T, ...], Tuple[slice, ...]]]
+        # Map from the number of fields to the most recently used layout
+        self._recent_layouts = (
+            {}
+        )  # type: Dict[int, Tuple[Tuple[T, ...], Tuple[T, ...], Tuple[slice, ...]]]
+        # Map from labels to function matching a whole line of the layout
+        self._matchers = (
+            {}
+        )  # type: Dict[Tuple[T, ...], Callable[[T], Optional[Match[T]]]]
+        # Labels of lines parsed without layout
+        self._seen_labels = set()  # type: Set[Tuple[T, ...]]
+        # Lock held while updating layouts
+        self._lock = _thread.allocate_lock()  # type: _thread.LockType
+        # Labels and matchers of the two layouts used last, the latest first.
+        # The tuple is replaced as a whole so that threads sharing the
+        # parser see labels and matcher of the same layout.
+        self._last = [
+            ((), _never_match, (), _never_match)
+        ]  # type: List[Tuple[Tuple[T, ...], Callable[[T], Optional[Match[T]]], Tuple[T, ...], Callable[[T], Optional[Match[T]]]]]
+        self._parse = (
+            self._specialize_parse()
+        )  # type: Callable[[T], Iterable[Tuple[T, T]]]
+        parse = type(self).parse
+        if getattr(parse, "__func__", parse) is _base_parse:
+            # Skip dispatching by method unless a subclass overrides it
+            self.parse = self._parse  # type: ignore
         return
 
     def parse(self, line):
@@ -171,6 +659,9 @@ class BaseLineParser(Generic[T]):
 
         Errors will be raised only when strict is set to True.
 
+        Lines are parsed by the function returned by _specialize_parse,
+        which replaces this method of instances unless it is overridden.
+
         :param line: Line to parse.
         :returns: Parsed object.
         :raises EmptyFieldParseError: Empty field found in input
@@ -178,15 +669,277 @@ class BaseLineParser(Generic[T]):
         :raises InvalidLabelParseError: Invalid label found in input
         :raises InvalidValueParseError: Invalid value found in input
         """
-        for eol in self.eols:
-            if line.endswith(eol):
-                line = line[: len(eol) * (-1)]
-                break
+        return self._parse(line)
 
-        if len(line) == 0:
-            return []
+    def _specialize_parse(self):
+        # type: () -> Callable[[T], Iterable[Tuple[T, T]]]
+        """Get parse function specialized to the current configuration.
+
+        Settings are bound to local variables, and default eols are
+        stripped without a loop.
+
+        A line is first matched against regexes of the two layouts used
+        last, which extract all values in C. Other lines are split into
+        fields, and fields matching the recent layout of the same number of
+        fields are checked and sliced by map, without looping over them in
+        Python. Strict mode has its own function, which also validates
+        values of sliced fields.
+
+        :returns: Function to parse one line
+        """
+        delimiter = self.delimiter
+        eols = tuple(self.eols)
+        recent_layouts = self._recent_layouts
+        parse_fields = self._parse_fields_without_layout
+        use_layout = self._use_layout
+        last = self._last
+        startswith = type(delimiter).startswith
+        getitem = type(delimiter).__getitem__  # type: Callable[[T, slice], T]
+
+        # Dedicated handler for the default eols, \r\n and \n, unused with
+        # other eols
+        default_eols = eols in ((u"\r\n", u"\n"), (b"\r\n", b"\n"))
+        crlf, lf = eols[:2] if default_eols else (delimiter, delimiter)
+
+        def parse(line):
+            # type: (T) -> Iterable[Tuple[T, T]]
+            labels, match, labels2, match2 = last[0]
+            m = match(line)
+            if m is not None:
+                return list(zip(labels, m.groups()))
+            m = match2(line)
+            if m is not None:
+                last[0] = (labels2, match2, labels, match)
+                return list(zip(labels2, m.groups()))
+            if default_eols:
+                if line.endswith(lf):
+                    line = line[:-2] if line.endswith(crlf) else line[:-1]
+            else:
+                for eol in eols:
+                    if line.endswith(eol):
+                        line = line[: -len(eol)]
+                        break
+            if not line:
+                return []
+            fields = line.split(delimiter)
+            layout = recent_layouts.get(len(fields))
+            if layout is not None:
+                labels, prefixes, slices = layout
+                if all(map(startswith, fields, prefixes)):
+                    r = list(zip(labels, map(getitem, fields, slices)))
+                    use_layout(layout)
+                    return r
+            return parse_fields(line, fields)
+
+        if not self.strict:
+            return parse
+
+        # Values cannot contain delimiter, so values are valid when the
+        # whole line has none of the other rejected chars
+        check_values = self._check_values
+        reject_search = self._reject_line_re.search
+
+        def parse_strict(line):
+            # type: (T) -> Iterable[Tuple[T, T]]
+            # Values matched in strict mode have no rejected chars
+            labels, match, labels2, match2 = last[0]
+            m = match(line)
+            if m is not None:
+                return list(zip(labels, m.groups()))
+            m = match2(line)
+            if m is not None:
+                last[0] = (labels2, match2, labels, match)
+                return list(zip(labels2, m.groups()))
+            if default_eols:
+                if line.endswith(lf):
+                    line = line[:-2] if line.endswith(crlf) else line[:-1]
+            else:
+                for eol in eols:
+                    if line.endswith(eol):
+                        line = line[: -len(eol)]
+                        break
+            if not line:
+                return []
+            fields = line.split(delimiter)
+            layout = recent_layouts.get(len(fields))
+            if layout is not None:
+                labels, prefixes, slices = layout
+                if all(map(startswith, fields, prefixes)):
+                    r = list(zip(labels, map(getitem, fields, slices)))
+                    if reject_search(line) is not None:
+                        check_values(r, line)
+                    use_layout(layout)
+                    return r
+            return parse_fields(line, fields)
+
+        return parse_strict
 
-        fields = line.split(self.delimiter)
+    def _use_layout(self, layout):
+        # type: (Tuple[Tuple[T, ...], Tuple[T, ...], Tuple[slice, ...]]) -> None
+        """Match following lines against regex of reused layout first.
+
+        :param layout: Label layout
+        """
+        last = self._last
+        labels = layout[0]
+        labels1, match1, labels2, match2 = last[0]
+        if labels1 is labels:
+            return
+        if labels2 is labels:
+            last[0] = (labels2, match2, labels1, match1)
+        else:
+            last[0] = (labels, self._get_matcher(layout), labels1, match1)
+        return
+
+    def _get_matcher(self, layout):
+        # type: (Tuple[Tuple[T, ...], Tuple[T, ...], Tuple[slice, ...]]) -> Callable[[T], Optional[Match[T]]]
+        """Get function matching a whole line of layout.
+
+        The function returns a match object whose groups are values, or
+        None for lines that may not be parsed the same as by splitting.
+        Values may not contain any char of delimiter and eols, or rejected
+        chars in strict mode, and the line may end with only one eol that
+        would be stripped.
+
+        :param layout: Label layout
+        :returns: Match function
+        """
+        labels, prefixes, _ = layout
+        matcher = self._matchers.get(labels)
+        if matcher is None:
+            matcher = self._compile_matcher(prefixes, [True] * len(prefixes))
+            self._matchers[labels] = matcher
+        return matcher
+
+    def _compile_matcher(self, prefixes, captured):
+        # type: (Iterable[T], Iterable[bool]) -> Callable[[T], Optional[Match[T]]]
+        """Compile function matching a whole line of labels.
+
+        :param prefixes: Labels followed by label delimiter
+        :param captured: Whether to capture the value of each field
+        :returns: Match function, or _never_match if lines of this
+            configuration cannot be matched by regex
+        """
+        empty = self._empty_value
+        delimiter = self.delimiter
+        eols = list(self.eols)
+        if (
+            len(delimiter) == 0
+            or any(len(eol) == 0 for eol in eols)
+            or any(c in self.labeldelimiter for c in _chars(delimiter))
+            or any(c in eol for c in _chars(self.labeldelimiter) for eol in eols)
+        ):
+            return _never_match
+        excluded = set(_chars(delimiter))
+        for eol in eols:
+            excluded.update(_chars(eol))
+        if self.strict:
+            for c in self._reject_value_chars:
+                excluded.add(_lit(empty, chr(c) if isinstance(c, int) else c))
+        value = (
+            _lit(empty, u"[^")
+            + empty.join(sorted(re.escape(c) for c in excluded))
+            + _lit(empty, u"]*")
+        )
+        group = _lit(empty, u"(") + value + _lit(empty, u")")
+        # Eols that would be stripped instead of a preceding one
+        strippable = [
+            eol
+            for i, eol in enumerate(eols)
+            if not any(eol.endswith(e) for e in eols[:i])
+        ]
+        pattern = (
+            re.escape(delimiter).join(
+                [
+                    re.escape(p) + (group if c else value)
+                    for p, c in zip(prefixes, captured)
+                ]
+            )
+            + _lit(empty, u"(?:")
+            + _lit(empty, u"|").join([re.escape(eol) for eol in strippable])
+            + _lit(empty, u")?\\Z")
+        )
+        return re.compile(pattern).match
+
+    def _parse_fields_without_layout(self, line, fields):
+        # type: (T, List[T]) -> List[Tuple[T, T]]
+        """Parse fields that did not match the recent layout.
+
+        :param line: Line to parse, used for error messages
+        :param fields: Fields split from line
+        :returns: Parsed object
+        """
+        if self.layout_cache_size > 0:
+            return self._parse_fields_with_layouts(line, fields)
+        return self._parse_fields(line, fields)
+
+    def _parse_fields_with_layouts(self, line, fields):
+        # type: (T, List[T]) -> List[Tuple[T, T]]
+        """Parse fields and remember their label layout.
+
+        :param line: Line to parse, used for error messages
+        :param fields: Fields split from line
+        :returns: Parsed object
+        """
+        labeldelimiter = self.labeldelimiter
+        parts = [field.partition(labeldelimiter) for field in fields]
+        if not all([sep for _, sep, _ in parts]):
+            return self._parse_fields(line, fields)
+        labels = tuple([l for l, _, _ in parts])
+
+        with self._lock:
+            layouts = self._layouts
+            layout = layouts.pop(labels, None)
+            checked = False
+            if layout is None:
+                seen = self._seen_labels
+                if labels not in seen:
+                    # Creating a layout costs more than parsing fields, so
+                    # layouts are created only for labels seen before
+                    if len(seen) >= 4 * self.layout_cache_size:
+                        seen.clear()
+                    seen.add(labels)
+                    if self.strict and not self._is_strictly_valid_line(line, labels):
+                        # Raise the same error as without layout
+                        return self._parse_fields(line, fields)
+                    return [(l, v) for l, _, v in parts]
+                if self.strict:
+                    # Raise the same error as without layout
+                    self._parse_fields(line, fields)
+                    checked = True
+                layout = (
+                    labels,
+                    tuple([l + labeldelimiter for l in labels]),
+                    tuple([slice(len(l) + len(labeldelimiter), None) for l in labels]),
+                )
+                if len(layouts) >= self.layout_cache_size:
+                    old = layouts.pop(next(iter(layouts)))
+                    self._matchers.pop(old[0], None)
+                    if self._recent_layouts.get(len(old[0])) is old:
+                        del self._recent_layouts[len(old[0])]
+            else:
+                self._use_layout(layout)
+            # Re-insert to keep layouts ordered from the least recently used one
+            layouts[labels] = layout
+            self._recent_layouts[len(labels)] = layout
+
+        r = [(l, v) for l, (_, _, v) in zip(layout[0], parts)]
+        if self.strict and not checked:
+            self._check_values(r, line)
+        return r
+
+    def _parse_fields(self, line, fields):
+        # type: (T, List[T]) -> List[Tuple[T, T]]
+        """Parse fields one by one.
+
+        :param line: Line to parse, used for error messages
+        :param fields: Fields split from line
+        :returns: Parsed object
+        :raises EmptyFieldParseError: Empty field found in input
+        :raises LabelOnlyParseError: label delimiter was not found in field
+        :raises InvalidLabelParseError: Invalid label found in input
+        :raises InvalidValueParseError: Invalid value found in input
+        """
         r = []
         for field in fields:
             if len(field) == 0:
@@ -214,9 +967,40 @@ class BaseLineParser(Generic[T]):
                 r.append((field, self._empty_value))
         return r
 
+    def _check_values(self, r, line):
+        # type: (List[Tuple[T, T]], T) -> None
+        """Validate values of parsed object.
+
+        :param r: Parsed object
+        :param line: Line to parse, used for error messages
+        :raises InvalidValueParseError: Invalid value found in input
+        """
+        for _, v in r:
+            if not self._is_strictly_valid_value(v):
+                raise self.InvalidValueParseError(
+                    "Invalid char found in value: {!r}".format(v), line
+                )
+        return
+
     # For T==text, use FrozenSet[Text], for T==bytes, use FrozenSet[int]
     _accept_label_chars = None  # type: ClassVar[FrozenSet[Union[Text, int]]]
     _reject_value_chars = None  # type: ClassVar[FrozenSet[Union[Text, int]]]
+    _reject_line_re = None  # type: ClassVar[Pattern[T]]
+    _reject_label_re = None  # type: ClassVar[Pattern[T]]
+
+    def _is_strictly_valid_line(self, line, labels):
+        # type: (T, Tuple[T, ...]) -> bool
+        """Return False when labels or values of LINE do not strictly follow spec.
+
+        :param line: Line without eol, whose fields all have label delimiter
+        :param labels: Labels of the fields
+        :returns: True if labels and values are in valid format
+        """
+        return (
+            all(labels)
+            and self._reject_label_re.search(self._empty_value.join(labels)) is None
+            and self._reject_line_re.search(line) is None
+        )
 
     def _is_strictly_valid_label(self, label):
         # type: (T,) -> bool
@@ -245,6 +1029,10 @@ class BaseLineParser(Generic[T]):
         return True
 
 
+# Plain function of BaseLineParser.parse, also on Python 2.7
+_base_parse = BaseLineParser.__dict__["parse"]
+
+
 class StrLineParser(BaseLineParser[Text]):
     """LTSV line parser for unicode str."""
 
@@ -258,6 +1046,10 @@ class StrLineParser(BaseLineParser[Text]):
     # Not %x01-08 / %x0B / %x0C / %x0E-FF
     # NULL, \t, \n, \r
     _reject_value_chars = frozenset(u"\x00\x09\x0a\x0d")
+    # Rejected chars other than delimiter
+    _reject_line_re = re.compile(u"[\x00\x0a\x0d]")
+    # Chars other than accepted ones
+    _reject_label_re = re.compile(u"[^0-9A-Za-z_.-]")
 
 
 class BytesLineParser(BaseLineParser[bytes]):
@@ -275,3 +1067,7 @@ class BytesLineParser(BaseLineParser[bytes]):
     # Not %x01-08 / %x0B / %x0C / %x0E-FF
     # NULL, \t, \n, \r
     _reject_value_chars = frozenset(b"\x00\x09\x0a\x0d")
+    # Rejected chars other than delimiter
+    _reject_line_re = re.compile(b"[\x00\x0a\x0d]")
+    # Chars other than accepted ones
+    _reject_label_re = re.compile(b"[^0-9A-Za-z_.-]")
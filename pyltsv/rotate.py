@@ -0,0 +1,341 @@
+"""Rotating LTSV file writer."""
+
+import atexit
+import io
+import os
+import time
+import weakref
+
+from typing import IO
+from typing import List
+from typing import Optional
+from typing import Type
+from typing import Union
+from typing import cast
+
+from .write import _INPUT_DICT
+from .write import _INPUT_TUPLE
+from .write import BaseLineFormatter
+from .write import BaseWriter
+from .write import BytesLineFormatter
+
+
+class RotatingWriter(BaseWriter[bytes]):
+    """LTSV writer to a file rotated by size or time.
+
+    Rows are formatted in the calling thread and written to the file by a
+    background thread, which writes queued lines in batches. Rotated
+    segments are renamed to path.1, path.2, ... (older ones have larger
+    numbers), and are gzipped when compress is True.
+
+    Errors raised in the background thread are raised again from the next
+    writerow, flush or close call. Writing goes on after an error: when
+    rotation fails, lines are written to the current file, and lines lost
+    by a failed write are counted in dropped.
+
+    Writers not closed yet are closed at interpreter exit, so that queued
+    lines are written.
+    """
+
+    def __init__(
+        self,
+        path,
+        formatter=None,
+        max_bytes=0,
+        interval=0,
+        backup_count=5,
+        compress=False,
+        queue_size=4096,
+        overflow="block",
+        batch_size=1024,
+        buffering=256 * 1024,
+    ):
+        # type: (str, Optional[BaseLineFormatter[bytes]], int, float, int, bool, int, str, int, int) -> None
+        """Initialize.
+
+        :param path: Path to the file to write
+        :param formatter: BaseLineFormatter object, BytesLineFormatter by default
+        :param max_bytes: Rotate before the file exceeds this size, 0 to disable
+        :param interval: Rotate every this seconds, 0 to disable
+        :param backup_count: The number of rotated segments to keep
+        :param compress: Gzip rotated segments
+        :param queue_size: Max number of lines waiting to be written
+        :param overflow: "block" to wait or "drop" to drop rows when queue is full
+        :param batch_size: Max number of lines written at once
+        :param buffering: Buffer size of the file
+        :raises ValueError: Invalid overflow value given
+        """
+        # threading takes a few ms to import, and only writer threads use it
+        import threading
+
+        from six.moves import queue
+
+        if overflow not in ("block", "drop"):
+            raise ValueError("overflow must be 'block' or 'drop'")
+        self._path = path
+        self._max_bytes = max_bytes
+        self._interval = interval
+        self._backup_count = backup_count
+        self._compress = compress
+        self._block = overflow == "block"
+        self._batch_size = batch_size
+        self._buffering = buffering
+        # The number of rows dropped by writerow and by the background thread
+        self._dropped_full = 0
+        self._dropped_error = 0
+
+        super(RotatingWriter, self).__init__(
+            self._open(), formatter or BytesLineFormatter()
+        )
+        self._queue = queue.Queue(queue_size)  # type: queue.Queue[Optional[bytes]]
+        self._queue_full = queue.Full  # type: Type[Exception]
+        self._queue_empty = queue.Empty  # type: Type[Exception]
+        self._error = None  # type: Optional[BaseException]
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="pyltsv-RotatingWriter")
+        self._thread.daemon = True
+        self._thread.start()
+        _writers.add(self)
+        return
+
+    @property
+    def dropped(self):
+        # type: () -> int
+        """Get the number of rows dropped when queue was full or writing failed.
+
+        :returns: The number of dropped rows
+        """
+        return self._dropped_full + self._dropped_error
+
+    def __enter__(self):
+        # type: () -> RotatingWriter
+        """Enter context.
+
+        :returns: self
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        # type: (object) -> None
+        """Close writer on exit.
+
+        :param exc_info: Exception information
+        """
+        self.close()
+        return
+
+    def writerow(self, row):
+        # type: (Union[_INPUT_DICT[bytes], _INPUT_TUPLE[bytes]]) -> int
+        """Queue one row object to write.
+
+        :param row: Input object
+        :returns: the number of bytes queued, 0 when the row was dropped
+        :raises ValueError: Writer is closed
+        """
+        self._raise_error()
+        if self._closed:
+            raise ValueError("Writer is closed")
+        line = self._formatter.format(row)
+        if self._block:
+            self._queue.put(line)
+        else:
+            try:
+                self._queue.put_nowait(line)
+            except self._queue_full:
+                self._dropped_full += 1
+                return 0
+        return len(line)
+
+    def flush(self):
+        # type: () -> None
+        """Wait until queued lines are written and flushed."""
+        self._queue.join()
+        self._raise_error()
+        return
+
+    def close(self):
+        # type: () -> None
+        """Write all queued lines and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        _writers.discard(self)
+        self._raise_error()
+        return
+
+    def _raise_error(self):
+        # type: () -> None
+        """Raise error of background thread if any."""
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+        return
+
+    def _open(self):
+        # type: () -> IO[bytes]
+        """Open the file to write and set rotation state.
+
+        :returns: Binary file object
+        """
+        f = io.open(self._path, "ab", buffering=self._buffering)
+        self._size = f.seek(0, io.SEEK_END)  # type: int
+        self._rollover_at = (
+            time.time() + self._interval if self._interval > 0 else None
+        )  # type: Optional[float]
+        return f
+
+    def _run(self):
+        # type: () -> None
+        """Write queued lines until None is given."""
+        q = self._queue
+        running = True
+        while running:
+            batch = [q.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except self._queue_empty:
+                    break
+            if batch[-1] is None:
+                running = False
+                batch.pop()
+            try:
+                try:
+                    self._write_batch(cast(List[bytes], batch))
+                finally:
+                    # Lines written before an error are flushed too
+                    if not running or q.empty():
+                        self._ltsvfile.flush()
+            except Exception as e:
+                # Keep the first error until it is raised
+                if self._error is None:
+                    self._error = e
+            finally:
+                for _ in range(len(batch) + (0 if running else 1)):
+                    q.task_done()
+        try:
+            self._ltsvfile.close()
+        except Exception as e:
+            self._error = self._error or e
+        return
+
+    def _write_batch(self, lines):
+        # type: (List[bytes]) -> None
+        """Write lines, rotating the file when needed.
+
+        When rotation fails, the rest of lines are written to the current
+        file and the error is raised after that. When writing fails, lines
+        not written are counted as dropped.
+
+        :param lines: Formatted lines
+        """
+        error = None  # type: Optional[Exception]
+        if self._rollover_at is not None and time.time() >= self._rollover_at:
+            if self._size > 0:
+                error = self._try_rotate()
+            else:
+                self._rollover_at = time.time() + self._interval
+        chunk = []  # type: List[bytes]
+        chunk_size = 0
+        written = 0
+        try:
+            for line in lines:
+                if (
+                    error is None
+                    and self._max_bytes > 0
+                    and self._size + chunk_size > 0
+                    and self._size + chunk_size + len(line) > self._max_bytes
+                ):
+                    self._ltsvfile.write(b"".join(chunk))
+                    self._size += chunk_size
+                    written += len(chunk)
+                    chunk = []
+                    chunk_size = 0
+                    error = self._try_rotate()
+                chunk.append(line)
+                chunk_size += len(line)
+            self._ltsvfile.write(b"".join(chunk))
+            self._size += chunk_size
+        except Exception:
+            self._dropped_error += len(lines) - written
+            raise
+        if error is not None:
+            raise error
+        return
+
+    def _try_rotate(self):
+        # type: () -> Optional[Exception]
+        """Rotate the file.
+
+        :returns: Error raised while rotating, None on success
+        """
+        try:
+            self._rotate()
+        except Exception as e:
+            return e
+        return None
+
+    def _rotate(self):
+        # type: () -> None
+        """Close the current file, shift segments and open a new file.
+
+        The file is opened again even when shifting segments fails, so
+        that following lines can be written.
+        """
+        self._ltsvfile.close()
+        try:
+            suffix = ".gz" if self._compress else ""
+            if self._backup_count > 0:
+                for i in range(self._backup_count - 1, 0, -1):
+                    src = "{}.{}{}".format(self._path, i, suffix)
+                    if os.path.exists(src):
+                        os.rename(src, "{}.{}{}".format(self._path, i + 1, suffix))
+                dst = "{}.1".format(self._path)
+                os.rename(self._path, dst)
+                if self._compress:
+                    _gzip_file(dst)
+            else:
+                os.remove(self._path)
+        finally:
+            self._ltsvfile = self._open()
+        return
+
+
+# Writers to close at exit, referenced weakly not to keep them alive
+_writers = weakref.WeakSet()  # type: weakref.WeakSet[RotatingWriter]
+
+
+def _close_writers():
+    # type: () -> None
+    """Close writers at interpreter exit, writing their queued lines."""
+    error = None  # type: Optional[BaseException]
+    for w in list(_writers):
+        try:
+            w.close()
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+    return
+
+
+atexit.register(_close_writers)
+
+
+def _gzip_file(path):
+    # type: (str) -> None
+    """Compress file into path.gz and remove the original.
+
+    :param path: Path to the file
+    """
+    import gzip
+    import shutil
+
+    with io.open(path, "rb") as src:
+        with gzip.open(path + ".gz", "wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+    os.remove(path)
+    return
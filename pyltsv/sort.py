@@ -0,0 +1,214 @@
+"""Sort LTSV files larger than memory."""
+
+import heapq
+import io
+import os
+
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Text
+from typing import Tuple
+from typing import Union
+
+from .read import breader
+from .write import bwriter
+
+DEFAULT_MEMORY_LIMIT = 256 * 1024 * 1024
+
+# Buffer size used for input, output and run files
+DEFAULT_BUFFER_SIZE = 256 * 1024
+
+# Rough memory used by Python objects of parsed records
+_RECORD_OVERHEAD = 120
+_FIELD_OVERHEAD = 150
+
+_RECORD = List[Tuple[bytes, bytes]]
+
+
+def sort_file(
+    src,
+    dst,
+    key="time",
+    numeric=False,
+    stable=True,
+    unique=False,
+    memory_limit=DEFAULT_MEMORY_LIMIT,
+    tmpdir=None,
+    strict=False,
+    buffering=DEFAULT_BUFFER_SIZE,
+):
+    # type: (str, str, Union[bytes, Text], bool, bool, bool, int, Optional[str], bool, int) -> int
+    """Sort LTSV file by a label.
+
+    Records are read with breader into runs of about memory_limit bytes,
+    each run is sorted in memory and written to a temporary file, and the
+    runs are merged into dst.
+
+    In numeric mode values are parsed as float. Records without the label,
+    or whose value is not a number or is NaN in numeric mode, come first.
+
+    When stable is True records of the same key keep their input order,
+    otherwise they are ordered by their contents. When unique is True,
+    records of the same key are ordered by their contents and identical
+    records are written only once.
+
+    :param src: Input file path
+    :param dst: Output file path
+    :param key: Label to sort records by
+    :param numeric: Compare values as numbers
+    :param stable: Keep input order of records of the same key
+    :param unique: Remove duplicate records
+    :param memory_limit: Approximate max bytes of records kept in memory
+    :param tmpdir: Directory to create temporary files
+    :param strict: Enable strict parsing
+    :param buffering: Buffer size of files
+    :returns: The number of records written
+    """
+    if not isinstance(key, bytes):
+        key = key.encode("ascii")
+    sortkey = _get_sortkey(key, numeric)
+    stable = stable and not unique
+
+    if stable:
+        chunkkey = sortkey
+    else:
+        chunkkey = lambda r: (sortkey(r), r)  # noqa: E731
+
+    runs = []  # type: List[str]
+    try:
+        chunk = []  # type: List[_RECORD]
+        size = 0
+        with io.open(src, "rb", buffering=buffering) as f:
+            for record in breader(f, strict=strict):
+                record = list(record)
+                n = _estimate_size(record)
+                if chunk and size + n > memory_limit:
+                    chunk.sort(key=chunkkey)
+                    runs.append(_write_run(chunk, tmpdir, buffering))
+                    chunk = []
+                    size = 0
+                chunk.append(record)
+                size += n
+        chunk.sort(key=chunkkey)
+        if not runs:
+            # Everything fit in memory
+            return _write(dst, iter(chunk), unique, buffering)
+        if chunk:
+            runs.append(_write_run(chunk, tmpdir, buffering))
+        chunk = []
+
+        sources = [
+            _iter_run(path, i, sortkey, stable, buffering)
+            for i, path in enumerate(runs)
+        ]
+        merged = (item[-1] for item in heapq.merge(*sources))
+        return _write(dst, merged, unique, buffering)
+    finally:
+        for path in runs:
+            os.remove(path)
+
+
+def _get_sortkey(key, numeric):
+    # type: (bytes, bool) -> Callable[[_RECORD], Tuple[Any, ...]]
+    """Get function to compute sort key of record.
+
+    :param key: Label to sort records by
+    :param numeric: Compare values as numbers
+    :returns: Function to compute sort key
+    """
+
+    def sortkey(record):
+        # type: (_RECORD) -> Tuple[Any, ...]
+        for l, v in record:
+            if l == key:
+                if not numeric:
+                    return (1, v)
+                try:
+                    x = float(v)
+                except ValueError:
+                    break
+                if x != x:
+                    # NaN is not ordered with any number
+                    break
+                return (1, x)
+        return (0,)
+
+    return sortkey
+
+
+def _estimate_size(record):
+    # type: (_RECORD) -> int
+    """Estimate memory used by record.
+
+    :param record: Parsed record
+    :returns: Approximate bytes
+    """
+    n = _RECORD_OVERHEAD
+    for l, v in record:
+        n += len(l) + len(v) + _FIELD_OVERHEAD
+    return n
+
+
+def _write_run(records, tmpdir, buffering):
+    # type: (List[_RECORD], Optional[str], int) -> str
+    """Write sorted records into temporary file.
+
+    :param records: Sorted records
+    :param tmpdir: Directory to create temporary file
+    :param buffering: Buffer size of file
+    :returns: Path to the file
+    """
+    # tempfile takes about 10 ms to import, and only large inputs need it
+    import tempfile
+
+    fd, path = tempfile.mkstemp(prefix="pyltsv-sort-", suffix=".ltsv", dir=tmpdir)
+    with io.open(fd, "wb", buffering=buffering) as f:
+        bwriter(f).writerows(records)
+    return path
+
+
+def _iter_run(path, index, sortkey, stable, buffering):
+    # type: (str, int, Callable[[_RECORD], Tuple[Any, ...]], bool, int) -> Iterator[Tuple[Any, ...]]
+    """Read records of sorted run with their merge keys.
+
+    :param path: Path to run file
+    :param index: Index of the run, used to keep order of same keys
+    :param sortkey: Function to compute sort key
+    :param stable: Keep input order of records of the same key
+    :param buffering: Buffer size of file
+    :yields: Tuple of merge keys and record, record is the last item
+    """
+    with io.open(path, "rb", buffering=buffering) as f:
+        for seq, record in enumerate(breader(f)):
+            record = list(record)
+            if stable:
+                yield (sortkey(record), index, seq, record)
+            else:
+                yield (sortkey(record), record)
+    return
+
+
+def _write(dst, records, unique, buffering):
+    # type: (str, Iterator[_RECORD], bool, int) -> int
+    """Write sorted records into dst.
+
+    :param dst: Output file path
+    :param records: Sorted records
+    :param unique: Skip records identical to the previous one
+    :param buffering: Buffer size of file
+    :returns: The number of records written
+    """
+    n = 0
+    last = None  # type: Optional[_RECORD]
+    with io.open(dst, "wb", buffering=buffering) as f:
+        w = bwriter(f)
+        for record in records:
+            if unique and record == last:
+                continue
+            last = record
+            w.writerow(record)
+            n += 1
+    return n
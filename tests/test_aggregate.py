@@ -0,0 +1,138 @@
+# mypy: allow-untyped-decorators
+# -*- coding: utf-8 -*-
+"""Test aggregate."""
+
+import pickle
+import random
+import unittest
+
+from six import BytesIO
+
+import pyltsv
+
+from pyltsv.aggregate import aggregate
+from pyltsv.aggregate import Aggregator
+from pyltsv.aggregate import QuantileSketch
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test QuantileSketch."""
+
+    def test_quantile(self):
+        # type: () -> None
+        """Test estimated quantiles are within relative accuracy."""
+        rng = random.Random(0)
+        values = [rng.uniform(0.001, 10.0) for _ in range(10000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for x in values:
+            sketch.add(x)
+        values.sort()
+        for q in (0.0, 0.5, 0.9, 0.99, 1.0):
+            expected = values[int(q * (len(values) - 1))]
+            actual = sketch.quantile(q)
+            assert actual is not None
+            self.assertAlmostEqual(actual / expected, 1.0, delta=0.011)
+        return
+
+    def test_quantile_signs(self):
+        # type: () -> None
+        """Test sketch with negative values and zeros."""
+        sketch = QuantileSketch()
+        for x in (-10.0, 0.0, 0.0, 10.0, 20.0):
+            sketch.add(x)
+        self.assertAlmostEqual(sketch.quantile(0.0) or 0.0, -10.0, delta=0.1)
+        self.assertEqual(sketch.quantile(0.5), 0.0)
+        self.assertAlmostEqual(sketch.quantile(1.0) or 0.0, 20.0, delta=0.2)
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+        return
+
+    def test_max_buckets(self):
+        # type: () -> None
+        """Test number of buckets is bounded."""
+        sketch = QuantileSketch(max_buckets=10)
+        for i in range(1, 1000):
+            sketch.add(float(i))
+        self.assertLessEqual(len(sketch._positive.buckets), 10)
+        self.assertEqual(sketch.count, 999)
+        self.assertAlmostEqual(sketch.quantile(1.0) or 0.0, 999.0, delta=10.0)
+        return
+
+    def test_merge(self):
+        # type: () -> None
+        """Test merging sketches."""
+        a = QuantileSketch()
+        b = QuantileSketch()
+        for i in range(1, 101):
+            (a if i % 2 else b).add(float(i))
+        a.merge(b)
+        self.assertEqual(a.count, 100)
+        self.assertAlmostEqual(a.quantile(0.5) or 0.0, 50.0, delta=1.0)
+        with self.assertRaises(ValueError):
+            a.merge(QuantileSketch(relative_accuracy=0.1))
+        return
+
+    def test_non_finite(self):
+        # type: () -> None
+        """Test sketch rejects NaN and infinities."""
+        sketch = QuantileSketch()
+        for x in (float("inf"), float("-inf"), float("nan")):
+            with self.assertRaises(ValueError):
+                sketch.add(x)
+        self.assertEqual(sketch.count, 0)
+        return
+
+
+class TestAggregate(unittest.TestCase):
+    """Test aggregate."""
+
+    def test_aggregate(self):
+        # type: () -> None
+        """Test basic usage of aggregate."""
+        f = BytesIO(
+            b"time:10:00:01\thost:a\treqtime:1\n"
+            b"time:10:00:02\thost:a\treqtime:3\n"
+            b"time:10:01:00\thost:a\treqtime:-\n"
+            b"time:10:01:00\treqtime:5\n"
+        )
+        groups = aggregate(
+            pyltsv.breader(f),
+            group_by=[b"host", (b"time", lambda v: v[:5])],
+            value=b"reqtime",
+        )
+        self.assertEqual(
+            sorted(groups, key=repr),
+            sorted([(b"a", b"10:00"), (b"a", b"10:01"), (None, b"10:01")], key=repr),
+        )
+        stats = groups[(b"a", b"10:00")]
+        self.assertEqual((stats.count, stats.n), (2, 2))
+        self.assertEqual((stats.sum, stats.min, stats.max), (4.0, 1.0, 3.0))
+        self.assertAlmostEqual(stats.quantile(1.0) or 0.0, 3.0, delta=0.03)
+        stats = groups[(b"a", b"10:01")]
+        self.assertEqual((stats.count, stats.n, stats.min), (1, 0, None))
+        return
+
+    def test_aggregate_non_finite(self):
+        # type: () -> None
+        """Test values of NaN and infinities are only counted as records."""
+        f = BytesIO(b"t:inf\nt:1e400\nt:-inf\nt:nan\nt:2\n")
+        stats = pyltsv.aggregate.aggregate(pyltsv.breader(f), value=b"t")[()]
+        self.assertEqual((stats.count, stats.n), (5, 1))
+        self.assertEqual((stats.sum, stats.min, stats.max), (2.0, 2.0, 2.0))
+        return
+
+    def test_merge(self):
+        # type: () -> None
+        """Test merging pickled groups of another aggregator."""
+        a = pyltsv.Aggregator(group_by=[b"host"], value=b"reqtime")
+        b = Aggregator(group_by=[b"host"], value=b"reqtime")
+        a.add_records(
+            pyltsv.breader(BytesIO(b"host:x\treqtime:1\nhost:y\treqtime:2\n"))
+        )
+        b.add_records(pyltsv.breader(BytesIO(b"host:x\treqtime:5\n")))
+        a.merge(pickle.loads(pickle.dumps(b.groups)))
+        stats = a.groups[(b"x",)]
+        self.assertEqual(
+            (stats.count, stats.sum, stats.min, stats.max), (2, 6.0, 1.0, 5.0)
+        )
+        self.assertEqual(a.groups[(b"y",)].count, 1)
+        return
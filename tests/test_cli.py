@@ -0,0 +1,125 @@
+# mypy: allow-untyped-decorators
+# -*- coding: utf-8 -*-
+"""Test command-line interface."""
+
+import unittest
+
+from typing import List
+from typing import Text
+from typing import Tuple
+
+from parameterized import parameterized
+from six import BytesIO
+from six import StringIO
+
+from pyltsv.cli import main
+
+
+def _run(argv, input_):
+    # type: (List[str], bytes) -> Tuple[int, bytes, Text]
+    """Run main with given input.
+
+    :param argv: Command-line arguments
+    :param input_: Data given to stdin
+    :returns: Tuple of exit status, stdout and stderr
+    """
+    stdout = BytesIO()
+    stderr = StringIO()
+    ret = main(argv, stdin=BytesIO(input_), stdout=stdout, stderr=stderr)
+    return ret, stdout.getvalue(), stderr.getvalue()
+
+
+class TestMain(unittest.TestCase):
+    """Test main."""
+
+    @parameterized.expand(
+        [
+            ("cut", ["cut", "-l", "c,a"], b"a:1\tb:2\tc:3\n", b"a:1\tc:3\n"),
+            ("cutempty", ["cut", "-l", "x"], b"a:1\n", b"\n"),
+            ("grep", ["grep", "a=^1"], b"a:1\nb:1\na:21\n", b"a:1\n"),
+            ("grepinvert", ["grep", "-v", "a=^1"], b"a:1\nb:1\n", b"b:1\n"),
+            (
+                "tojson",
+                ["to-json"],
+                b"b:1\ta:\xe3\x81\x82\n",
+                u'{"b":"1","a":"あ"}\n'.encode("utf-8"),
+            ),
+            (
+                "fromjson",
+                ["from-json"],
+                b'{"b": 1, "a": "x", "c": null}\n\n',
+                b"b:1\ta:x\tc:\n",
+            ),
+            (
+                "stats",
+                ["stats"],
+                b"a:1\tb:2\n\na:3\n",
+                b"records:3\tfields:3\nlabel:a\tcount:2\nlabel:b\tcount:1\n",
+            ),
+        ]
+    )
+    def test_command(self, name, argv, input_, expected):
+        # type: (str, List[str], bytes, bytes) -> None
+        """Test output of commands.
+
+        :param name: Name of this parameter
+        :param argv: Command-line arguments
+        :param input_: Data given to stdin
+        :param expected: Expected output
+        """
+        ret, out, err = _run(argv, input_)
+        self.assertEqual(ret, 0)
+        self.assertEqual(out, expected)
+        self.assertEqual(err, u"")
+        return
+
+    def test_grep_nomatch(self):
+        # type: () -> None
+        """Test grep exits with 1 when nothing matches."""
+        ret, out, _ = _run(["grep", "a=2"], b"a:1\n")
+        self.assertEqual(ret, 1)
+        self.assertEqual(out, b"")
+        return
+
+    def test_grep_invalid(self):
+        # type: () -> None
+        """Test grep with invalid expressions."""
+        ret, _, err = _run(["grep", "a"], b"a:1\n")
+        self.assertEqual(ret, 2)
+        self.assertIn(u"LABEL=PATTERN", err)
+        ret, _, err = _run(["grep", "a=("], b"a:1\n")
+        self.assertEqual(ret, 2)
+        self.assertIn(u"pyltsv: invalid pattern:", err)
+        return
+
+    def test_from_json_invalid(self):
+        # type: () -> None
+        """Test from-json with non-object input."""
+        ret, _, err = _run(["from-json"], b"[1]\n")
+        self.assertEqual(ret, 1)
+        self.assertIn(u"-:1:", err)
+        ret, _, err = _run(["from-json"], b'{"a":1}\n\xff\n')
+        self.assertEqual(ret, 1)
+        self.assertIn(u"-:2:", err)
+        self.assertIn(u"can't decode", err)
+        return
+
+    def test_validate(self):
+        # type: () -> None
+        """Test validate reports every invalid line."""
+        input_ = b"a:1\n\ta:1\nb\na:2\n"
+        self.assertEqual(_run(["validate"], input_)[0], 0)
+        ret, _, err = _run(["validate", "--strict"], input_)
+        self.assertEqual(ret, 1)
+        self.assertEqual(len(err.splitlines()), 2)
+        self.assertIn(u"-:2:", err)
+        self.assertIn(u"-:3:", err)
+        return
+
+    def test_missing_file(self):
+        # type: () -> None
+        """Test input file that does not exist."""
+        ret, _, err = _run(["stats", "/nonexistent/file.ltsv"], b"")
+        self.assertEqual(ret, 1)
+        self.assertIn(u"pyltsv:", err)
+        return
@@ -0,0 +1,111 @@
+# mypy: allow-untyped-decorators
+# -*- coding: utf-8 -*-
+"""Test convert."""
+
+import io
+import unittest
+
+from six import BytesIO
+from six import PY2
+
+from pyltsv import convert
+
+
+class TestJsonl(unittest.TestCase):
+    """Test conversion between LTSV and JSON Lines."""
+
+    def test_ltsv_to_jsonl(self):
+        # type: () -> None
+        """Test basic usage of ltsv_to_jsonl."""
+        src = BytesIO(u"b:1\ta:あ\n\nc:\"\\\n".encode("utf-8"))
+        dst = BytesIO()
+        n = convert.ltsv_to_jsonl(src, dst, batch_size=2)
+        self.assertEqual(n, 3)
+        self.assertEqual(
+            dst.getvalue(),
+            u'{"b":"1","a":"あ"}\n{}\n{"c":"\\"\\\\"}\n'.encode("utf-8"),
+        )
+        return
+
+    def test_jsonl_to_ltsv(self):
+        # type: () -> None
+        """Test basic usage of jsonl_to_ltsv."""
+        src = BytesIO(b'{"b": "1", "a": 2}\n\n{"c": null, "d": [true]}\n')
+        dst = BytesIO()
+        n = convert.jsonl_to_ltsv(src, dst, batch_size=2)
+        self.assertEqual(n, 2)
+        self.assertEqual(dst.getvalue(), b"b:1\ta:2\nc:\td:[true]\n")
+        return
+
+    def test_jsonl_to_ltsv_not_object(self):
+        # type: () -> None
+        """Test jsonl_to_ltsv with input that is not a JSON object."""
+        with self.assertRaises(convert.ConvertError) as cm:
+            convert.jsonl_to_ltsv(BytesIO(b"\n1\n"), BytesIO())
+        self.assertEqual(cm.exception.lineno, 2)
+        self.assertEqual(str(cm.exception), "2: JSON object expected")
+        return
+
+    def test_jsonl_to_ltsv_invalid(self):
+        # type: () -> None
+        """Test jsonl_to_ltsv with labels and values that would break LTSV."""
+        for line in (
+            b'{"a":"x\\ty:z"}\n',
+            b'{"a":"1\\n2"}\n',
+            b'{"a":"1\\r"}\n',
+            b'{"a:b":"1"}\n',
+            b'{"a\\tb":"1"}\n',
+        ):
+            dst = BytesIO()
+            with self.assertRaises(convert.ConvertError) as cm:
+                convert.jsonl_to_ltsv(BytesIO(b'{"a":"1:2"}\n' + line), dst)
+            self.assertEqual(cm.exception.lineno, 2)
+        with self.assertRaises(ValueError):
+            convert.jsonl_to_ltsv(BytesIO(b'{"a":"\xff"}\n'), BytesIO())
+        return
+
+
+@unittest.skipIf(PY2, "csv module works on bytes in Python 2")
+class TestCsv(unittest.TestCase):
+    """Test conversion between LTSV and CSV."""
+
+    def test_ltsv_to_csv(self):
+        # type: () -> None
+        """Test ltsv_to_csv discovering header from sample."""
+        src = BytesIO(b"a:1\tb:x,y\nb:2\tc:3\nd:4\n")
+        dst = io.StringIO(newline="")
+        n = convert.ltsv_to_csv(src, dst, sample_size=2, batch_size=2)
+        self.assertEqual(n, 3)
+        self.assertEqual(dst.getvalue(), u'a,b,c\r\n1,"x,y",\r\n,2,3\r\n,,\r\n')
+        return
+
+    def test_ltsv_to_csv_labels(self):
+        # type: () -> None
+        """Test ltsv_to_csv with explicit labels."""
+        src = BytesIO(b"a:1\tb:2\n")
+        dst = io.StringIO(newline="")
+        convert.ltsv_to_csv(src, dst, labels=[b"b", b"x"])
+        self.assertEqual(dst.getvalue(), u"b,x\r\n2,\r\n")
+        return
+
+    def test_csv_to_ltsv(self):
+        # type: () -> None
+        """Test basic usage of csv_to_ltsv."""
+        src = io.StringIO(u'a,b\r\n1,"x,y"\r\n2,3,4\r\n', newline="")
+        dst = BytesIO()
+        n = convert.csv_to_ltsv(src, dst, batch_size=1)
+        self.assertEqual(n, 2)
+        self.assertEqual(dst.getvalue(), b"a:1\tb:x,y\na:2\tb:3\n")
+        return
+
+    def test_csv_to_ltsv_invalid(self):
+        # type: () -> None
+        """Test csv_to_ltsv with values that would break LTSV."""
+        src = io.StringIO(u'a,b\r\n1,2\r\n3,"x\ty"\r\n', newline="")
+        with self.assertRaises(convert.ConvertError) as cm:
+            convert.csv_to_ltsv(src, BytesIO())
+        self.assertEqual(cm.exception.lineno, 3)
+        src = io.StringIO(u'a:b\r\n1\r\n', newline="")
+        with self.assertRaises(convert.ConvertError):
+            convert.csv_to_ltsv(src, BytesIO())
+        return
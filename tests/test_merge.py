@@ -0,0 +1,101 @@
+# mypy: allow-untyped-decorators
+# -*- coding: utf-8 -*-
+"""Test merge."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from typing import List
+
+import pyltsv
+
+
+class TestMergeReaders(unittest.TestCase):
+    """Test merge_readers."""
+
+    def setUp(self):
+        # type: () -> None
+        """Create temporary directory."""
+        self.tmpdir = tempfile.mkdtemp()
+        return
+
+    def tearDown(self):
+        # type: () -> None
+        """Remove temporary directory."""
+        shutil.rmtree(self.tmpdir)
+        return
+
+    def _write(self, name, content):
+        # type: (str, bytes) -> str
+        """Write temporary file.
+
+        :param name: File name
+        :param content: File content
+        :returns: Path to the file
+        """
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def _values(self, records, label=b"v"):
+        # type: (object, bytes) -> List[bytes]
+        """Get values of label from records.
+
+        :param records: Iterable of records
+        :param label: Label to get
+        :returns: List of values
+        """
+        return [dict(r)[label] for r in records]  # type: ignore
+
+    def test_merge(self):
+        # type: () -> None
+        """Test basic usage of merge_readers."""
+        a = self._write("a", b"time:1\tv:a1\ntime:3\tv:a3\n\ntime:3\tv:a4\n")
+        b = self._write("b", b"time:2\tv:b2\ntime:3\tv:b3\ntime:5\tv:b5\n")
+        c = self._write("c", b"")
+        actual = self._values(pyltsv.merge_readers([a, b, c]))
+        self.assertEqual(actual, [b"a1", b"b2", b"a3", b"a4", b"b3", b"b5"])
+        return
+
+    def test_merge_keyfunc(self):
+        # type: () -> None
+        """Test merge_readers with key function."""
+        a = self._write("a", b"t:9\tv:a9\nt:10\tv:a10\n")
+        b = self._write("b", b"t:2\tv:b2\nt:11\tv:b11\n")
+        actual = self._values(pyltsv.merge_readers([a, b], key=u"t", keyfunc=int))
+        self.assertEqual(actual, [b"b2", b"a9", b"a10", b"b11"])
+        return
+
+    def test_merge_out_of_order(self):
+        # type: () -> None
+        """Test merge_readers with input out of order."""
+        a = self._write("a", b"time:2\tv:a2\ntime:1\tv:a1\n")
+        with self.assertRaises(pyltsv.OutOfOrderError):
+            _ = list(pyltsv.merge_readers([a]))
+        actual = self._values(pyltsv.merge_readers([a], check=False))
+        self.assertEqual(actual, [b"a2", b"a1"])
+        return
+
+    def test_merge_window(self):
+        # type: () -> None
+        """Test merge_readers tolerating disorder within window."""
+        a = self._write("a", b"time:2\tv:a2\ntime:1\tv:a1\ntime:4\tv:a4\n")
+        b = self._write("b", b"time:3\tv:b3\n")
+        actual = self._values(pyltsv.merge_readers([a, b], keyfunc=int, window=1))
+        self.assertEqual(actual, [b"a1", b"a2", b"b3", b"a4"])
+
+        c = self._write("c", b"time:5\tv:c5\ntime:2\tv:c2\n")
+        with self.assertRaises(pyltsv.OutOfOrderError):
+            _ = list(pyltsv.merge_readers([c], keyfunc=int, window=1))
+        return
+
+    def test_merge_key_not_found(self):
+        # type: () -> None
+        """Test merge_readers with record without key."""
+        a = self._write("a", b"time:1\nv:1\n")
+        with self.assertRaises(pyltsv.KeyNotFoundError):
+            _ = list(pyltsv.merge_readers([a]))
+        return
@@ -2,8 +2,13 @@
 # -*- coding: utf-8 -*-
 """Test reader."""
 
+import pickle
+import sys
+import threading
 import unittest
 
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Text
@@ -67,6 +72,86 @@ class TestBreader(unittest.TestCase):
         self.assertEqual(list(ret[2]), [(b"a", b"3"), (b"b", b"4")])
         return
 
+    def test_decode(self):
+        # type: () -> None
+        """Test breader decoding into unicode str."""
+        f = BytesIO(u"a:あ\tb:2\n\na:\xff\n".encode("utf-8") + b"a:\xff\tc:\xff\n")
+        ret = list(
+            pyltsv.breader(f, decode="utf-8", errors="replace", labels=[u"a", u"b"])
+        )
+        self.assertEqual(len(ret), 4)
+        self.assertEqual(list(ret[0]), [(u"a", u"あ"), (u"b", u"2")])
+        self.assertEqual(list(ret[1]), [])
+        self.assertEqual(list(ret[2]), [(u"a", u"\xff")])
+        self.assertEqual(list(ret[3]), [(u"a", u"\ufffd")])
+        return
+
+    def test_decode_config(self):
+        # type: () -> None
+        """Test breader decoding with custom delimiters and strict mode."""
+        f = BytesIO(b"a=>1,b=>2\r\n" * 3)
+        ret = list(
+            pyltsv.breader(
+                f, delimiter=b",", labeldelimiter=b"=>", decode="ascii", labels=[u"b"]
+            )
+        )
+        self.assertEqual([list(r) for r in ret], [[(u"b", u"2")]] * 3)
+        r = pyltsv.breader(
+            BytesIO(b"a:1\tb:2\n" * 3 + b"a:1\tb:\x002\n"),
+            strict=True,
+            decode="utf-8",
+            labels=[u"a"],
+        )
+        with self.assertRaises(pyltsv.InvalidValueParseError):
+            _ = list(r)
+        return
+
+    def test_decode_labels(self):
+        # type: () -> None
+        """Test breader decoding only given labels the same as reader."""
+        text = (
+            u"a:1\tb:2\tc:3\nc:4\n" * 3
+            + u"b:\tc:あ\ta:\u3042:\r\n" * 3
+            + u"c:5\ta\tc:6\n\tc:7\n" * 2
+            + u"c:8"
+        )
+        labels = [u"c", u"a"]
+        expected = [
+            [(l, v) for l, v in r if l in labels]
+            for r in pyltsv.reader(StringIO(text))
+        ]
+        f = BytesIO(text.encode("utf-8"))
+        ret = pyltsv.breader(f, decode="utf-8", labels=labels)
+        self.assertEqual([list(r) for r in ret], expected)
+        return
+
+    def test_decode_error(self):
+        # type: () -> None
+        """Test breader with undecodable input."""
+        r = pyltsv.breader(BytesIO(b"a:\xff\n"), decode="utf-8", labels=[u"a"])
+        with self.assertRaises(UnicodeDecodeError):
+            _ = list(r)
+        r = pyltsv.breader(BytesIO(b"a:1\tb:\xff\n"), decode="utf-8", labels=[u"a"])
+        self.assertEqual([list(x) for x in r], [[(u"a", u"1")]])
+        return
+
+    @parameterized.expand(
+        [
+            ("decode", {"decode": "utf-8"}),
+            ("labels", {"labels": [u"a"]}),
+        ]
+    )
+    def test_decode_without_labels(self, name, kwargs):
+        # type: (str, Dict[str, Any]) -> None
+        """Test breader with only one of decode and labels.
+
+        :param name: Name of this parameter
+        :param kwargs: Keyword arguments of breader
+        """
+        with self.assertRaises(pyltsv.ParserConfigError):
+            _ = pyltsv.breader(BytesIO(b""), **kwargs)
+        return
+
 
 class TestStrLineParser(unittest.TestCase):
     """Test StrLineParser."""
@@ -213,3 +298,377 @@ class TestBytesLineParser(unittest.TestCase):
         with self.assertRaises(expected_err):  # type: ignore
             _ = parser.parse(input)
         return
+
+
+class TestIncrementalParser(unittest.TestCase):
+    """Test IncrementalParser."""
+
+    @parameterized.expand(
+        [
+            (
+                "basic",
+                None,
+                [b"a:1\tb:", b"2\r\n\nc:3\n"],
+                [[(b"a", b"1"), (b"b", b"2")], [], [(b"c", b"3")]],
+                [],
+            ),
+            (
+                "onebyte",
+                None,
+                [b"a", b":", b"1", b"\r", b"\n", b"\n"],
+                [[(b"a", b"1")], []],
+                [],
+            ),
+            (
+                "noeol",
+                None,
+                [b"a:1\n", b"c", b":3"],
+                [[(b"a", b"1")]],
+                [[(b"c", b"3")]],
+            ),
+            (
+                "custom",
+                (b"||",),
+                [b"a:1|", b"|", b"|c:3||"],
+                [[(b"a", b"1")], [(b"|c", b"3")]],
+                [],
+            ),
+            (
+                "prefix",
+                (b"\r\n", b"\r"),
+                [b"a:1\r", b"\nb:2\r", b"\r\n"],
+                [[(b"a", b"1")], [(b"b", b"2")], []],
+                [],
+            ),
+            (
+                "heldback",
+                (b"\r\n\r", b"\r"),
+                [b"a:1\r", b"\n", b"b:2\r\n", b"\r"],
+                [[(b"a", b"1")], [(b"\nb", b"2")]],
+                [],
+            ),
+            (
+                "heldbackclose",
+                (b"\r\n\r", b"\r", b"\n"),
+                [b"a:1\r", b"\n"],
+                [],
+                [[(b"a", b"1")], []],
+            ),
+        ]
+    )
+    def test_feed(self, name, eols, chunks, expected, expected_close):
+        # type: (str, Optional[Tuple[bytes, ...]], List[bytes], List[List[Tuple[bytes, bytes]]], List[List[Tuple[bytes, bytes]]]) -> None
+        """Test feeding input in chunks.
+
+        :param name: Name of this parameter
+        :param eols: Possible eol values
+        :param chunks: Input chunks
+        :param expected: Expected parsed results of feed
+        :param expected_close: Expected parsed results of close
+        """
+        p = pyltsv.IncrementalParser(BytesLineParser(eols=eols))
+        actual = []  # type: List[List[Tuple[bytes, bytes]]]
+        for chunk in chunks:
+            actual.extend(list(r) for r in p.feed(chunk))
+        self.assertEqual(actual, expected)
+        self.assertEqual([list(r) for r in p.close()], expected_close)
+        self.assertEqual(p.close(), [])
+        return
+
+    @parameterized.expand(
+        [
+            ("default", None),
+            ("cr", (b"\r\n", b"\n", b"\r")),
+            ("prefix", (b"\r\n", b"\r")),
+            ("overlap", (b"\r\n\r", b"\r\n", b"\n")),
+            ("custom", (b"||", b"|\t")),
+        ]
+    )
+    def test_feed_chunk_size(self, name, eols):
+        # type: (str, Optional[Tuple[bytes, ...]]) -> None
+        """Test results do not depend on chunk boundaries.
+
+        :param name: Name of this parameter
+        :param eols: Possible eol values
+        """
+        data = b"a:1\r\n\rb:2\r\r\n|\t\nc:||3\n\r\r\n\r\n|\t|d:4\r"
+
+        def feed_all(size):
+            # type: (int) -> List[List[Tuple[bytes, bytes]]]
+            p = pyltsv.IncrementalParser(BytesLineParser(eols=eols))
+            r = []  # type: List[List[Tuple[bytes, bytes]]]
+            for i in range(0, len(data), size):
+                r.extend(list(x) for x in p.feed(data[i : i + size]))
+            r.extend(list(x) for x in p.close())
+            return r
+
+        expected = feed_all(len(data))
+        for size in range(1, len(data)):
+            self.assertEqual(feed_all(size), expected, size)
+        return
+
+    def test_feed_str(self):
+        # type: () -> None
+        """Test feeding unicode str."""
+        p = pyltsv.IncrementalParser(StrLineParser())
+        self.assertEqual(p.feed(u"a:1\nb"), [[(u"a", u"1")]])
+        self.assertEqual(p.feed(u""), [])
+        self.assertEqual(p.feed(u":2\n"), [[(u"b", u"2")]])
+        self.assertEqual(p.close(), [])
+        return
+
+
+class TestLineParserLayoutCache(unittest.TestCase):
+    """Test label layout cache of line parser."""
+
+    def test_parse_layouts(self):
+        # type: () -> None
+        """Test parsing lines of changing layouts."""
+        parser = BytesLineParser()
+        parser.layout_cache_size = 2
+        lines = [
+            (b"a:1\tb:2\n", [(b"a", b"1"), (b"b", b"2")]),
+            (b"a:3\tb:4:5\n", [(b"a", b"3"), (b"b", b"4:5")]),
+            (b"a:6\tc:7\n", [(b"a", b"6"), (b"c", b"7")]),
+            (b"x:8\n", [(b"x", b"8")]),
+            (b"a:9\tb\n", [(b"a", b"9"), (b"b", b"")]),
+            (b"a:1\tb:2\n", [(b"a", b"1"), (b"b", b"2")]),
+            (b"ab:1\tb:2\n", [(b"ab", b"1"), (b"b", b"2")]),
+            (b"\ta:1\tb:2\n", [(b"a", b"1"), (b"b", b"2")]),
+            (b":1\tb:2\n", [(b"", b"1"), (b"b", b"2")]),
+            (b":1\tb:2\n", [(b"", b"1"), (b"b", b"2")]),
+            (b"\tb:2\n", [(b"b", b"2")]),
+        ]
+        for line, expected in lines:
+            self.assertEqual(list(parser.parse(line)), expected)
+        self.assertLessEqual(len(parser._layouts), 2)
+        return
+
+    def test_parse_shared_between_threads(self):
+        # type: () -> None
+        """Test threads sharing a parser evict layouts of each other safely."""
+        parser = BytesLineParser()
+        parser.layout_cache_size = 2
+        lines = []  # type: List[Tuple[bytes, List[Tuple[bytes, bytes]]]]
+        for l in (b"a", b"b", b"c"):
+            for v in (b"1", b"2", b"3"):
+                line = l + b":" + v + b"\tx" + v + b":" + l + b"\n"
+                lines.append((line, [(l, v), (b"x" + v, l)]))
+        errors = []  # type: List[BaseException]
+
+        def run():
+            # type: () -> None
+            try:
+                for _ in range(300):
+                    for line, expected in lines:
+                        actual = list(parser.parse(line))
+                        if actual != expected:
+                            raise AssertionError((line, actual))
+            except BaseException as e:
+                errors.append(e)
+            return
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=run) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(parser._layouts), 2)
+        return
+
+    def test_parse_multichar_labeldelimiter(self):
+        # type: () -> None
+        """Test parsing lines of a cached layout with long label delimiter."""
+        parser = BytesLineParser(labeldelimiter=b"::")
+        for _ in range(3):
+            self.assertEqual(
+                list(parser.parse(b"a::1\tb::2:3\n")), [(b"a", b"1"), (b"b", b"2:3")]
+            )
+        return
+
+    def test_parse_shares_labels(self):
+        # type: () -> None
+        """Test labels are shared between records of the same layout.
+
+        Layout is created when the same labels are seen again.
+        """
+        parser = StrLineParser()
+        _ = parser.parse(u"label:1\n")
+        r2 = list(parser.parse(u"label:2\n"))
+        r3 = list(parser.parse(u"label:3\n"))
+        self.assertIs(r2[0][0], r3[0][0])
+        return
+
+    @parameterized.expand(
+        [
+            ("invalidvalue", u"a:1\n\tb:2\n", StrLineParser.InvalidValueParseError),
+            ("invalidlabel", u"a:1\t^:2\n", StrLineParser.InvalidLabelParseError),
+            ("labelonly", u"a:1\tb\n", StrLineParser.LabelOnlyParseError),
+        ]
+    )
+    def test_parse_strict_cached(self, name, input, expected_err):
+        # type: (str, Text, StrLineParser.ParseError) -> None
+        """Test strict parser after layout is cached.
+
+        :param name: Name of this parameter
+        :param input: Input line
+        :param expected_err: Expected Error
+        """
+        parser = StrLineParser(strict=True)
+        self.assertEqual(list(parser.parse(u"a:1\tb:2\n")), [(u"a", u"1"), (u"b", u"2")])
+        with self.assertRaises(expected_err):  # type: ignore
+            _ = parser.parse(input)
+        self.assertEqual(list(parser.parse(u"a:3\tb:4\n")), [(u"a", u"3"), (u"b", u"4")])
+        return
+
+
+class TestSpecializedParse(unittest.TestCase):
+    """Test parse specialized to parser configuration."""
+
+    @parameterized.expand(
+        [
+            ("default", {}),
+            ("strict", {"strict": True}),
+            ("eols", {"eols": (b"\r\n", b"\n")}),
+            ("lfonly", {"eols": (b"\n",)}),
+            ("lffirst", {"eols": (b"\n", b"\r\n")}),
+            ("custom", {"delimiter": b",", "labeldelimiter": b"=", "eols": (b"|",)}),
+            ("multichar", {"delimiter": b"\t\t", "labeldelimiter": b"::"}),
+            ("crlabel", {"labeldelimiter": b"\r"}),
+            ("crcrlabel", {"labeldelimiter": b"\r\r"}),
+        ]
+    )
+    def test_parse(self, name, kwargs):
+        # type: (str, Dict[str, object]) -> None
+        """Test specialized parse gives the same result as parsing fields.
+
+        Each line is parsed three times, so that the label layout and its
+        regex are used.
+
+        :param name: Name of this parameter
+        :param kwargs: Parameters of parser
+        """
+        lines = [
+            b"a:1\tb:2\n",
+            b"a:3\tb:4\r\n",
+            b"a:5\tb:6\r",
+            b"a=1,b=2|",
+            b"a=3,b=4|",
+            b"a=3,b=4||",
+            b"a::1\t\tb::2\n",
+            b"\n",
+            b"",
+            b"a:1\tc:2\n",
+            b"a:1\tb:\x002\n",
+            b"a:1\tb:2\r\r\n",
+            b"a:1\tb:2\n\n",
+            b"a:1\t\tb:2\n",
+            b"\rx\n",
+            b"\r\n",
+            b":a\r\rx\n",
+            b":a\r\r\n",
+        ]
+        specialized = BytesLineParser(**kwargs)  # type: ignore
+        generic = BytesLineParser(**kwargs)  # type: ignore
+        generic.layout_cache_size = 0
+        for line in lines:
+            for _ in range(3):
+                try:
+                    expected = list(generic.parse(line))
+                except BytesLineParser.ParseError as e:
+                    with self.assertRaises(type(e)):
+                        _ = specialized.parse(line)
+                    continue
+                self.assertEqual(list(specialized.parse(line)), expected)
+        return
+
+    def test_set_config(self):
+        # type: () -> None
+        """Test changing configuration after parsing."""
+        parser = BytesLineParser()
+        for _ in range(3):
+            self.assertEqual(list(parser.parse(b"a:1,b:2\n")), [(b"a", b"1,b:2")])
+        parser.delimiter = b","
+        self.assertEqual(list(parser.parse(b"a:1,b:2\n")), [(b"a", b"1"), (b"b", b"2")])
+        parser.labeldelimiter = b"="
+        self.assertEqual(
+            list(parser.parse(b"a:1,b:2\n")), [(b"a:1", b""), (b"b:2", b"")]
+        )
+        parser.strict = True
+        with self.assertRaises(BytesLineParser.LabelOnlyParseError):
+            _ = parser.parse(b"a:1,b:2\n")
+        return
+
+    def test_parse_shared_between_threads(self):
+        # type: () -> None
+        """Test threads sharing a parser get labels of their own lines."""
+        parser = BytesLineParser()
+        layouts = [(b"a", b"b"), (b"x", b"y"), (b"c", b"d")]
+        errors = []  # type: List[BaseException]
+
+        def run(labels):
+            # type: (Tuple[bytes, bytes]) -> None
+            line = labels[0] + b":1\t" + labels[1] + b":2\n"
+            expected = [(labels[0], b"1"), (labels[1], b"2")]
+            try:
+                for _ in range(3000):
+                    actual = list(parser.parse(line))
+                    if actual != expected:
+                        raise AssertionError((line, actual))
+            except BaseException as e:
+                errors.append(e)
+            return
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=run, args=(l,)) for l in layouts]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+        return
+
+    def test_subclass(self):
+        # type: () -> None
+        """Test parse overridden by subclass is used."""
+
+        class UpperParser(BytesLineParser):
+            def parse(self, line):
+                # type: (bytes) -> List[Tuple[bytes, bytes]]
+                r = super(UpperParser, self).parse(line)
+                return [(l.upper(), v) for l, v in r]
+
+        parser = UpperParser()
+        for _ in range(3):
+            self.assertEqual(list(parser.parse(b"a:1\n")), [(b"A", b"1")])
+        f = BytesIO(b"a:1\n" * 3)
+        self.assertEqual(
+            [list(r) for r in pyltsv.read.BytesReader(f, parser)], [[(b"A", b"1")]] * 3
+        )
+        parser.delimiter = b","
+        self.assertEqual(list(parser.parse(b"a:1,b:2\n")), [(b"A", b"1"), (b"B", b"2")])
+        return
+
+    def test_pickle(self):
+        # type: () -> None
+        """Test pickling parser."""
+        parser = StrLineParser(delimiter=u",")
+        for _ in range(3):
+            parser.parse(u"a:1,b:2\n")
+        parser = pickle.loads(pickle.dumps(parser))
+        self.assertEqual(parser.delimiter, u",")
+        for _ in range(3):
+            self.assertEqual(
+                list(parser.parse(u"a:1,b:2\n")), [(u"a", u"1"), (u"b", u"2")]
+            )
+        return
@@ -0,0 +1,203 @@
+# mypy: allow-untyped-decorators
+# -*- coding: utf-8 -*-
+"""Test rotate."""
+
+import gzip
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+from typing import List
+
+import pyltsv
+
+
+class TestRotatingWriter(unittest.TestCase):
+    """Test RotatingWriter."""
+
+    def setUp(self):
+        # type: () -> None
+        """Create temporary directory."""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "out.ltsv")
+        return
+
+    def tearDown(self):
+        # type: () -> None
+        """Remove temporary directory."""
+        shutil.rmtree(self.tmpdir)
+        return
+
+    def _read(self, path):
+        # type: (str) -> bytes
+        """Read file content.
+
+        :param path: Path to the file
+        :returns: Content
+        """
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            return f.read()
+
+    def test_write(self):
+        # type: () -> None
+        """Test basic usage of RotatingWriter."""
+        with open(self.path, "wb") as f:
+            f.write(b"a:0\n")
+        with pyltsv.RotatingWriter(self.path) as w:
+            n = w.writerows([[(b"a", b"1")], {b"a": b"2"}])
+            self.assertEqual(n, 8)
+            w.flush()
+            self.assertEqual(self._read(self.path), b"a:0\na:1\na:2\n")
+        with self.assertRaises(ValueError):
+            w.writerow([(b"a", b"3")])
+        return
+
+    def test_rotate_size(self):
+        # type: () -> None
+        """Test rotating by size."""
+        w = pyltsv.RotatingWriter(self.path, max_bytes=8, backup_count=2, batch_size=2)
+        for i in range(7):
+            w.writerow([(b"a", str(i).encode("ascii"))])
+        w.close()
+        self.assertEqual(
+            sorted(os.listdir(self.tmpdir)), ["out.ltsv", "out.ltsv.1", "out.ltsv.2"]
+        )
+        self.assertEqual(self._read(self.path), b"a:6\n")
+        self.assertEqual(self._read(self.path + ".1"), b"a:4\na:5\n")
+        self.assertEqual(self._read(self.path + ".2"), b"a:2\na:3\n")
+        return
+
+    def test_rotate_compress(self):
+        # type: () -> None
+        """Test compressing rotated segments."""
+        w = pyltsv.RotatingWriter(self.path, max_bytes=4, compress=True)
+        w.writerows([[(b"a", b"1")], [(b"a", b"2")]])
+        w.close()
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ["out.ltsv", "out.ltsv.1.gz"])
+        self.assertEqual(self._read(self.path + ".1.gz"), b"a:1\n")
+        return
+
+    def test_rotate_interval(self):
+        # type: () -> None
+        """Test rotating by time."""
+        w = pyltsv.RotatingWriter(self.path, interval=1e-9)
+        w.writerow([(b"a", b"1")])
+        w.flush()
+        w.writerow([(b"a", b"2")])
+        w.close()
+        self.assertEqual(self._read(self.path), b"a:2\n")
+        self.assertEqual(self._read(self.path + ".1"), b"a:1\n")
+        return
+
+    def test_rotate_error(self):
+        # type: () -> None
+        """Test writing continues after rotation failed."""
+        w = pyltsv.RotatingWriter(self.path, max_bytes=4)
+        rename = os.rename
+        failures = []  # type: List[str]
+
+        def failing_rename(src, dst):
+            # type: (str, str) -> None
+            if not failures:
+                failures.append(src)
+                raise OSError("rename failed")
+            rename(src, dst)
+
+        os.rename = failing_rename  # type: ignore
+        try:
+            # Write one batch directly while the background thread is idle
+            with self.assertRaises(OSError):
+                w._write_batch([b"a:1\n", b"a:2\n", b"a:3\n"])
+            w.writerow([(b"a", b"4")])
+            w.close()
+        finally:
+            os.rename = rename
+        self.assertEqual(failures, [self.path])
+        self.assertEqual(self._read(self.path + ".1"), b"a:1\na:2\na:3\n")
+        self.assertEqual(self._read(self.path), b"a:4\n")
+        return
+
+    def test_write_error(self):
+        # type: () -> None
+        """Test writing continues after writing failed."""
+        w = pyltsv.RotatingWriter(self.path)
+        f = w._ltsvfile
+        failures = []  # type: List[bytes]
+
+        class FailingFile(object):
+            """File failing to write once."""
+
+            def write(self, b):
+                # type: (bytes) -> int
+                if not failures:
+                    failures.append(b)
+                    raise IOError("write failed")
+                return f.write(b)
+
+            def __getattr__(self, name):
+                # type: (str) -> object
+                return getattr(f, name)
+
+        w._ltsvfile = FailingFile()  # type: ignore
+        w.writerow([(b"a", b"1")])
+        with self.assertRaises(IOError):
+            w.flush()
+        w.writerow([(b"a", b"2")])
+        w.close()
+        self.assertEqual(failures, [b"a:1\n"])
+        self.assertEqual(self._read(self.path), b"a:2\n")
+        self.assertEqual(w.dropped, 1)
+        return
+
+    def test_close_at_exit(self):
+        # type: () -> None
+        """Test queued rows are written when writer is not closed at exit."""
+        code = (
+            "import sys, pyltsv\n"
+            "w = pyltsv.RotatingWriter(sys.argv[1], batch_size=1)\n"
+            "for i in range(1000):\n"
+            "    w.writerow([(b'a', str(i).encode('ascii'))])\n"
+        )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.dirname(os.path.dirname(pyltsv.__file__))
+        subprocess.check_call([sys.executable, "-c", code, self.path], env=env)
+        expected = b"".join(u"a:{}\n".format(i).encode("ascii") for i in range(1000))
+        self.assertEqual(self._read(self.path), expected)
+        return
+
+    def test_drop(self):
+        # type: () -> None
+        """Test dropping rows when queue is full."""
+        w = pyltsv.RotatingWriter(self.path, queue_size=1, overflow="drop")
+        started = threading.Event()
+        release = threading.Event()
+        write_batch = w._write_batch
+
+        def blocking_write_batch(lines):
+            # type: (List[bytes]) -> None
+            started.set()
+            release.wait()
+            write_batch(lines)
+
+        w._write_batch = blocking_write_batch  # type: ignore
+        self.assertEqual(w.writerow([(b"a", b"1")]), 4)
+        started.wait()
+        self.assertEqual(w.writerow([(b"a", b"2")]), 4)
+        self.assertEqual(w.writerow([(b"a", b"3")]), 0)
+        self.assertEqual(w.dropped, 1)
+        release.set()
+        w.close()
+        self.assertEqual(self._read(self.path), b"a:1\na:2\n")
+        return
+
+    def test_invalid_overflow(self):
+        # type: () -> None
+        """Test invalid overflow value."""
+        with self.assertRaises(ValueError):
+            _ = pyltsv.RotatingWriter(self.path, overflow="ignore")
+        return
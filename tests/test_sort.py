@@ -0,0 +1,104 @@
+# mypy: allow-untyped-decorators
+# -*- coding: utf-8 -*-
+"""Test sort."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from parameterized import parameterized
+
+import pyltsv
+
+
+class TestSortFile(unittest.TestCase):
+    """Test sort_file."""
+
+    def setUp(self):
+        # type: () -> None
+        """Create temporary directory."""
+        self.tmpdir = tempfile.mkdtemp()
+        self.src = os.path.join(self.tmpdir, "src")
+        self.dst = os.path.join(self.tmpdir, "dst")
+        self.runs = os.path.join(self.tmpdir, "runs")
+        os.mkdir(self.runs)
+        return
+
+    def tearDown(self):
+        # type: () -> None
+        """Remove temporary directory."""
+        shutil.rmtree(self.tmpdir)
+        return
+
+    def _sort(self, content, **kwargs):
+        # type: (bytes, object) -> bytes
+        """Sort content and return the result.
+
+        :param content: Input LTSV
+        :param kwargs: Parameters passed to sort_file
+        :returns: Sorted LTSV
+        """
+        with open(self.src, "wb") as f:
+            f.write(content)
+        pyltsv.sort_file(self.src, self.dst, tmpdir=self.runs, **kwargs)  # type: ignore
+        self.assertEqual(os.listdir(self.runs), [])
+        with open(self.dst, "rb") as f:
+            return f.read()
+
+    @parameterized.expand([("inmemory", 1024 * 1024), ("external", 1)])
+    def test_sort(self, name, memory_limit):
+        # type: (str, int) -> None
+        """Test sorting by string and number.
+
+        :param name: Name of this parameter
+        :param memory_limit: Memory limit
+        """
+        content = b"t:3\tv:a\nt:10\tv:b\nv:c\nt:3\tv:d\nt:1\tv:e\n"
+        self.assertEqual(
+            self._sort(content, key=u"t", memory_limit=memory_limit),
+            b"v:c\nt:1\tv:e\nt:10\tv:b\nt:3\tv:a\nt:3\tv:d\n",
+        )
+        self.assertEqual(
+            self._sort(content, key=u"t", numeric=True, memory_limit=memory_limit),
+            b"v:c\nt:1\tv:e\nt:3\tv:a\nt:3\tv:d\nt:10\tv:b\n",
+        )
+        return
+
+    @parameterized.expand([("inmemory", 1024 * 1024), ("external", 1)])
+    def test_sort_nan(self, name, memory_limit):
+        # type: (str, int) -> None
+        """Test NaN values are sorted as not numbers.
+
+        :param name: Name of this parameter
+        :param memory_limit: Memory limit
+        """
+        content = b"t:3\nt:nan\nt:1\nt:x\nt:-NaN\nt:2\nt:inf\nt:0\n"
+        self.assertEqual(
+            self._sort(content, key=u"t", numeric=True, memory_limit=memory_limit),
+            b"t:nan\nt:x\nt:-NaN\nt:0\nt:1\nt:2\nt:3\nt:inf\n",
+        )
+        return
+
+    @parameterized.expand([("inmemory", 1024 * 1024), ("external", 1)])
+    def test_sort_stable_unique(self, name, memory_limit):
+        # type: (str, int) -> None
+        """Test stable option and removing duplicates.
+
+        :param name: Name of this parameter
+        :param memory_limit: Memory limit
+        """
+        content = b"time:2\tv:b\ntime:1\tv:z\ntime:2\tv:a\ntime:2\tv:b\n"
+        self.assertEqual(
+            self._sort(content, memory_limit=memory_limit),
+            b"time:1\tv:z\ntime:2\tv:b\ntime:2\tv:a\ntime:2\tv:b\n",
+        )
+        self.assertEqual(
+            self._sort(content, stable=False, memory_limit=memory_limit),
+            b"time:1\tv:z\ntime:2\tv:a\ntime:2\tv:b\ntime:2\tv:b\n",
+        )
+        self.assertEqual(
+            self._sort(content, unique=True, memory_limit=memory_limit),
+            b"time:1\tv:z\ntime:2\tv:a\ntime:2\tv:b\n",
+        )
+        return